@@ -3,6 +3,8 @@ from typing import Union
 
 
 NUMERIC = Union[int, float]
+# keep this a tuple of concrete types rather than ABCs like numbers.Real, so
+# that isinstance() checks in hot setters never go through __instancecheck__
 NUMERIC_TYPECHECK = (int, float)
 
 
@@ -10,12 +10,17 @@ The bones of this module were originally created by Chris Beaumont
 but the core functionality was developed by them.
 """
 from __future__ import annotations
+import bisect
+from types import FunctionType, MethodType
 from typing import Any, Callable, Iterable, Iterator
 import weakref
 
 from curvefit import error_trace
 
 
+_NO_SETTER_MSG = "CallbackProperty has no setter for {!r}"
+
+
 """
 TODO: write unit tests
 TODO: render documentation and do final cleanup
@@ -66,12 +71,12 @@ def callback_property(getter: Callable) -> CallbackProperty:
 def callbacks(
     instance,
     prop_name: str | None = None
-) -> list[Callable] | dict[str, list[Callable]]:
+) -> tuple[Callable, ...] | dict[str, tuple[Callable, ...]]:
     """
-    Return a list of callback functions attached to an instance property.  If
+    Return a tuple of callback functions attached to an instance property.  If
     `prop_name` is omitted, returns a dictionary whose keys represent the
     names of all callback properties associated with `instance`, and whose
-    values are lists of the callback functions/methods that are attached to
+    values are tuples of the callback functions/methods that are attached to
     each key.
 
     Parameters
@@ -87,11 +92,11 @@ def callbacks(
     Returns
     -------
     :return:
-        A list of callback functions/methods for `prop_name`, or if `prop_name`
-        is omitted, a dictionary mapping the names of all the
-        CallbackProperties in `instance` to their corresponding list of bound
+        A tuple of callback functions/methods for `prop_name`, or if
+        `prop_name` is omitted, a dictionary mapping the names of all the
+        CallbackProperties in `instance` to their corresponding tuple of bound
         callback functions/methods.
-    :rtype: list[Callable] | dict[str, list[Callable]]
+    :rtype: tuple[Callable, ...] | dict[str, tuple[Callable, ...]]
 
     Raises
     ------
@@ -123,6 +128,101 @@ def callbacks(
     return prop.callbacks(instance)
 
 
+def _single_prop(props: str, callback) -> tuple:
+    """Pair a single property name with its callback(s)."""
+    return ((props, callback),)
+
+
+def _prop_sequence(props: Iterable[str], callback) -> Iterator[tuple]:
+    """Pair every property name in a sequence with the same callback(s)."""
+    return ((prop_name, callback) for prop_name in props)
+
+
+def _prop_dict(props: dict, callback) -> Iterable[tuple]:
+    """Pair property names with the callback(s) given in a dictionary."""
+    return props.items()
+
+
+# Exact-type dispatch for the `props` argument of add_callback/remove_callback.
+# These cover every common call signature with a single dict lookup; anything
+# else (subclasses, generators, etc.) falls back to isinstance checks.
+_PROPS_DISPATCH = {
+    str: _single_prop,
+    tuple: _prop_sequence,
+    list: _prop_sequence,
+    dict: _prop_dict
+}
+_CALLBACK_IS_SEQUENCE = {
+    FunctionType: False,
+    MethodType: False,
+    tuple: True,
+    list: True
+}
+
+
+def _pair_props(
+    props: (str | Iterable[str] | dict[str, Callable] |
+            dict[str, Iterable[Callable]]),
+    callback: Callable | Iterable[Callable] | None
+) -> Iterable[tuple[str, Callable | Iterable[Callable]]]:
+    """
+    Normalize the `props`/`callback` arguments of
+    :func:`~curvefit.callback.add_callback` and
+    :func:`~curvefit.callback.remove_callback` into an iterable of
+    `(prop_name, callback)` pairs.  Errors are reported against the calling
+    function.
+    """
+    handler = _PROPS_DISPATCH.get(type(props), None)
+    if handler is None:  # not an exact match
+        if isinstance(props, str):
+            handler = _single_prop
+        elif isinstance(props, dict):
+            handler = _prop_dict
+        elif isinstance(props, Iterable):
+            handler = _prop_sequence
+        else:  # not recognized
+            err_msg = (f"[{error_trace(stack_index=2)}] could not interpret "
+                       f"`props` (received: {repr(props)})")
+            raise TypeError(err_msg)
+    if handler is _prop_dict:  # dict-based, fine control
+        if callback is not None:
+            err_msg = (f"[{error_trace(stack_index=2)}] when passing a "
+                       f"callback dictionary, the `callback` argument should "
+                       f"not be used")
+            raise RuntimeError(err_msg)
+    elif callback is None:
+        err_msg = f"[{error_trace(stack_index=2)}] `callback` must not be None"
+        raise RuntimeError(err_msg)
+    return handler(props, callback)
+
+
+def _as_callbacks(
+    func: Callable | Iterable[Callable]
+) -> Iterable[Callable | Any]:
+    """Wrap a lone callback function/method in a tuple for iteration."""
+    is_sequence = _CALLBACK_IS_SEQUENCE.get(type(func), None)
+    if is_sequence is None:  # not an exact match
+        is_sequence = isinstance(func, Iterable)
+    return func if is_sequence else (func,)
+
+
+def _get_callback_property(instance, name: str) -> CallbackProperty:
+    """
+    Retrieve the CallbackProperty named `name` from the class of `instance`.
+    Errors are reported against the calling function.
+    """
+    if not isinstance(name, str):
+        err_msg = (f"[{error_trace(stack_index=2)}] property names must be "
+                   f"strings (received: {repr(name)})")
+        raise TypeError(err_msg)
+    cb_prop = getattr(type(instance), name)
+    if not isinstance(cb_prop, CallbackProperty):
+        err_msg = (f"[{error_trace(stack_index=2)}] {type(instance)}.{name} "
+                   f"is not a CallbackProperty")
+        raise ValueError(err_msg)
+    return cb_prop
+
+
 def add_callback(
     instance,
     props: (str | Iterable[str] | dict[str, Callable] |
@@ -206,59 +306,16 @@ def add_callback(
         add_callback(f, 'bar', [callback, f.callback])  # multiple callbacks
         add_callback(f, {'bar': callback, 'baz': f.callback})  # dict-based
     """
-    def get_cb_prop(name):
-        if not isinstance(name, str):
-            err_msg = (f"[{error_trace(stack_index=2)}] property names must "
-                       f"be strings (received: {repr(name)})")
-            raise TypeError(err_msg)
-        cb_prop = getattr(type(instance), name)
-        if not isinstance(cb_prop, CallbackProperty):
-            err_msg = (f"[{error_trace(stack_index=2)}] "
-                       f"{type(instance)}.{name} is not a CallbackProperty")
-            raise ValueError(err_msg)
-        return cb_prop
-
-    def try_add(cb_prop, func):
+    for prop_name, func in _pair_props(props, callback):
+        cb_prop = _get_callback_property(instance, prop_name)
         try:
-            if isinstance(func, Iterable):
-                for cb_func in func:
-                    cb_prop.add_callback(instance, cb_func, priority=priority)
-            else:
-                cb_prop.add_callback(instance, func, priority=priority)
+            for cb_func in _as_callbacks(func):
+                cb_prop.add_callback(instance, cb_func, priority=priority)
         except Exception as exc:
             err_msg = (f"[{error_trace()}] could not add callback(s): "
                        f"{repr(func)}")
             raise type(exc)(err_msg) from exc
 
-    if isinstance(props, str):  # single property, one or more callbacks
-        if callback is None:
-            err_msg = (f"[{error_trace()}] `callback` must not be None")
-            raise RuntimeError(err_msg)
-        cb_prop = get_cb_prop(props)
-        try_add(cb_prop, callback)
-
-    elif isinstance(props, dict):  # dict-based, fine control
-        if callback is not None:
-            err_msg = (f"[{error_trace()}] when passing a callback dictionary, "
-                       f"the `callback` argument should not be used")
-            raise RuntimeError(err_msg)
-        for prop_name, func in props.items():
-            cb_prop = get_cb_prop(prop_name)
-            try_add(cb_prop, func)
-
-    elif isinstance(props, Iterable):  # multiple properties, one/more callbacks
-        if callback is None:
-            err_msg = (f"[{error_trace()}] `callback` must not be None")
-            raise RuntimeError(err_msg)
-        for prop_name in props:
-            cb_prop = get_cb_prop(prop_name)
-            try_add(cb_prop, callback)
-
-    else:  # not recognized
-        err_msg = (f"[{error_trace()}] could not interpret `props` "
-                   f"(received: {repr(props)})")
-        raise TypeError(err_msg)
-
 
 def remove_callback(
     instance,
@@ -326,59 +383,16 @@ def remove_callback(
         remove_callback(f, 'bar', [callback, f.callback])  # multiple callbacks
         remove_callback(f, {'bar': callback, 'baz': f.callback})  # dict-based
     """
-    def get_cb_prop(name):
-        if not isinstance(name, str):
-            err_msg = (f"[{error_trace(stack_index=2)}] property names must "
-                       f"be strings (received: {repr(name)})")
-            raise TypeError(err_msg)
-        cb_prop = getattr(type(instance), name)
-        if not isinstance(cb_prop, CallbackProperty):
-            err_msg = (f"[{error_trace(stack_index=2)}] "
-                       f"{type(instance)}.{name} is not a CallbackProperty")
-            raise ValueError(err_msg)
-        return cb_prop
-
-    def try_remove(cb_prop, func):
+    for prop_name, func in _pair_props(props, callback):
+        cb_prop = _get_callback_property(instance, prop_name)
         try:
-            if isinstance(func, Iterable):
-                for cb_func in func:
-                    cb_prop.remove_callback(instance, cb_func)
-            else:
-                cb_prop.remove_callback(instance, func)
+            for cb_func in _as_callbacks(func):
+                cb_prop.remove_callback(instance, cb_func)
         except Exception as exc:
             err_msg = (f"[{error_trace()}] could not remove callback: "
                        f"{repr(func)}")
             raise type(exc)(err_msg) from exc
 
-    if isinstance(props, str):  # single property, one or more callbacks
-        if callback is None:
-            err_msg = (f"[{error_trace()}] `callback` must not be None")
-            raise RuntimeError(err_msg)
-        cb_prop = get_cb_prop(props)
-        try_remove(cb_prop, callback)
-
-    elif isinstance(props, dict):  # multiple properties, multiple callbacks
-        if callback is not None:
-            err_msg = (f"[{error_trace()}] when passing a callback dictionary, "
-                       f"the `callback` argument should not be used")
-            raise RuntimeError(err_msg)
-        for prop_name, func in props.items():
-            cb_prop = get_cb_prop(prop_name)
-            try_remove(cb_prop, func)
-
-    elif isinstance(props, Iterable):  # multiple properties, single callback
-        if callback is None:
-            err_msg = (f"[{error_trace()}] `callback` must not be None")
-            raise RuntimeError(err_msg)
-        for prop_name in props:
-            cb_prop = get_cb_prop(prop_name)
-            try_remove(cb_prop, callback)
-
-    else:  # not recognized
-        err_msg = (f"[{error_trace()}] could not interpret `props` "
-                   f"(received: {repr(props)})")
-        raise TypeError(err_msg)
-
 
 def clear_callbacks(instance, *props: str) -> None:
     """
@@ -515,7 +529,12 @@ class CallbackContainer:
 
     def append(self, value: Callable, priority: int = 0) -> None:
         """Append a Callable with priority level `priority` to this container"""
-        self.callbacks.append(self._wrap(value, priority=priority))
+        # keep callbacks in descending priority order, so that they can be
+        # dispatched without sorting.  Ties are broken by insertion order.
+        wrapped = self._wrap(value, priority=priority)
+        index = bisect.bisect_right(self.callbacks, -priority,
+                                    key=lambda x: -x[-1])
+        self.callbacks.insert(index, wrapped)
 
     def clear(self) -> None:
         """Clear the callback references associated with this container."""
@@ -552,8 +571,7 @@ class CallbackContainer:
         Iterates through container contents, yielding the associated callables
         as naked functions or bound instance methods.
         """
-        for callback in sorted(self.callbacks, key=lambda x: x[-1],
-                               reverse=True):
+        for callback in self.callbacks[:]:  # already sorted by priority
             if len(callback) == 3:
                 func = callback[0]()
                 inst = callback[1]()
@@ -613,9 +631,14 @@ class CallbackProperty:
         self._disabled = weakref.WeakKeyDictionary()
         self._getter = getter
         self._setter = setter
+        self._name = None
         if docstring is not None:
             self.__doc__ = docstring
 
+    def __set_name__(self, owner, name: str) -> None:
+        """Record the attribute name this property is bound to in `owner`."""
+        self._name = name
+
     def _default_getter(self, instance, owner=None):
         """
         Default getter for manual CallbackProperties (not created through
@@ -642,7 +665,12 @@ class CallbackProperty:
         callback functions if a state change is detected.
         """
         if self._setter is None:
-            raise AttributeError("CallbackProperty has no setter")
+            raise AttributeError(_NO_SETTER_MSG.format(self._name))
+        if (not self._callbacks.get(instance) and
+            not self._disabled.get(instance, False)):
+            # nothing to notify, so skip the old/new state comparison
+            self._setter(instance, value)
+            return
         try:
             old = self.__get__(instance)
         except AttributeError:  # pragma: no cover
@@ -692,16 +720,16 @@ class CallbackProperty:
         """
         return not self._disabled.get(instance, False)
 
-    def callbacks(self, instance) -> list[Callable]:
-        """Return a list of all callback functions/methods associated with this
-        CallbackProperty.
+    def callbacks(self, instance) -> tuple[Callable, ...]:
+        """Return a tuple of all callback functions/methods associated with
+        this CallbackProperty.
 
-        Modifications that are made to this list (i.e. appending/removing
-        values in-situ) are not propagated to the property itself.  For that,
-        see :meth:`~curvefit.CallbackProperty.add_callback` and
+        This is a snapshot of the callbacks at the time of the call.  To modify
+        the callbacks attached to the property itself, see
+        :meth:`~curvefit.CallbackProperty.add_callback` and
         :meth:`~curvefit.CallbackProperty.remove_callback`
         """
-        return list(self._callbacks.get(instance, []))
+        return tuple(self._callbacks.get(instance, ()))
 
     def add_callback(self,
                      instance,
@@ -21,11 +21,16 @@ color2 = color + (0.1, 0.1, 0.1)  # basic arithmetic for quick blends
 `
 """
 from __future__ import annotations
+import colorsys
 from functools import lru_cache
+from math import sqrt
 from string import hexdigits
+from typing import Callable
 
-import matplotlib as mpl
-from numpy import sqrt, isclose
+from matplotlib.colors import get_named_colors_mapping
+from matplotlib.colors import to_rgba as _mpl_to_rgba
+import numpy as np
+from numpy import isclose
 
 from curvefit import error_trace, NUMERIC, NUMERIC_TYPECHECK
 from curvefit.callback import callback_property
@@ -40,7 +45,7 @@ TODO: render documentation and do final cleanup
 
 NAMED_COLORS = {}
 COLORS_NAMED = {}
-for k, v in mpl.colors.get_named_colors_mapping().items():
+for k, v in get_named_colors_mapping().items():
     if isinstance(v, str):
         v = v.lower()
         NAMED_COLORS[k] = v
@@ -52,6 +57,8 @@ for k, v in mpl.colors.get_named_colors_mapping().items():
             # insort(COLORS_NAMED[v], k, key=len)
             COLORS_NAMED[v].append(k)
             COLORS_NAMED[v].sort(key=len)  # prefer colors without extensions
+NAMED_COLORS_KEYS = tuple(NAMED_COLORS)  # indexable, for random.sample
+COLORS_NAMED_KEYS = tuple(COLORS_NAMED)
 
 
 def to_rgba(
@@ -110,8 +117,7 @@ def to_rgba(
                 return hex_to_rgba(color_like)
 
     if isinstance(color_like, tuple):
-        if (all(isinstance(v, NUMERIC_TYPECHECK) for v in color_like) and
-            all(0 <= v <= 1 for v in color_like)):
+        if _is_unit_tuple(color_like):
             if space == "rgb":
                 if len(color_like) == 3:
                     return color_like + (alpha,)
@@ -130,12 +136,44 @@ def to_rgba(
     raise ValueError(err_msg)
 
 
+@lru_cache(maxsize=256)
+def _check_unit_tuple(values: tuple, types: tuple[type, ...]) -> bool:
+    """Cached body of :func:`_is_unit_tuple`.  `types` is part of the cache key
+    so that equal-but-differently-typed tuples (e.g. `(1, 0, 0)` and
+    `(Decimal(1), 0, 0)`) are checked separately.
+    """
+    return (all(issubclass(t, NUMERIC_TYPECHECK) for t in types) and
+            all(0 <= v <= 1 for v in values))
+
+
+def _is_unit_tuple(values: tuple) -> bool:
+    """Check whether a tuple contains only `NUMERIC`s in the range `[0, 1]`.
+
+    Results are memoized by value and element type, so color literals that
+    are parsed repeatedly (like `(0.5, 0.5, 0.5)`) are only validated once.
+
+    :param values: tuple of values to check
+    :type values: tuple
+    :return: `True` if every element of `values` is a numeric between 0 and 1
+    :rtype: bool
+    """
+    try:
+        return _check_unit_tuple(values, tuple(map(type, values)))
+    except TypeError:  # unhashable element, can't be numeric
+        return False
+
+
 @lru_cache(maxsize=128)
 def rgba_to_hex(
     rgba: tuple[NUMERIC, NUMERIC, NUMERIC, NUMERIC],
     keep_alpha: bool = True) -> str:
     """Convert an RGBA color to a hex code"""
-    return mpl.colors.to_hex(rgba, keep_alpha=keep_alpha)
+    red, green, blue, alpha = _mpl_to_rgba(rgba)
+    hex_code = (f"#{round(red * 255):02x}{round(green * 255):02x}"
+                f"{round(blue * 255):02x}")
+    if keep_alpha:
+        return f"{hex_code}{round(alpha * 255):02x}"
+    return hex_code
 
 
 @lru_cache(maxsize=128)
@@ -143,21 +181,165 @@ def hex_to_rgba(
     hex_code: str,
     alpha: NUMERIC = None) -> tuple[float, float, float, float]:
     """Convert a hex code to RGBA color"""
-    return mpl.colors.to_rgba(hex_code, alpha=alpha)
+    return _mpl_to_rgba(hex_code, alpha=alpha)
 
 
 @lru_cache(maxsize=128)
 def rgb_to_hsv(
     rgb: tuple[NUMERIC, NUMERIC, NUMERIC]) -> tuple[NUMERIC, NUMERIC, NUMERIC]:
     """Convert an RGB color to HSV color space"""
-    return tuple(mpl.colors.rgb_to_hsv(rgb))
+    # scalar stdlib conversion; mpl.colors.rgb_to_hsv is built for arrays and
+    # pays for ndarray construction/masking on every single-color call
+    red, green, blue = rgb
+    return colorsys.rgb_to_hsv(float(red), float(green), float(blue))
 
 
 @lru_cache(maxsize=128)
 def hsv_to_rgb(
     hsv: tuple[NUMERIC, NUMERIC, NUMERIC]) -> tuple[NUMERIC, NUMERIC, NUMERIC]:
     """Convert an HSV color to RGB color space"""
-    return tuple(mpl.colors.hsv_to_rgb(hsv))
+    hue, saturation, value = hsv
+    return colorsys.hsv_to_rgb(float(hue), float(saturation), float(value))
+
+
+def _blend_add(b: float, t: float) -> float:
+    """Scalar `'add'` blend, clipped to 1 without a `min()` call"""
+    result = b + t
+    return result if result <= 1.0 else 1.0
+
+
+def _blend_subtract(b: float, t: float) -> float:
+    """Scalar `'subtract'` blend, clipped to 0 without a `max()` call"""
+    result = b - t
+    return result if result >= 0.0 else 0.0
+
+
+def _blend_multiply(b: float, t: float) -> float:
+    """Scalar `'multiply'` blend"""
+    return b * t
+
+
+def _blend_divide(b: float, t: float) -> float:
+    """Scalar `'divide'` blend, clipped to 1 without a `min()` call"""
+    if t > 0:
+        result = b / t
+        return result if result <= 1.0 else 1.0
+    return 1.0
+
+
+def _blend_burn(b: float, t: float) -> float:
+    """Scalar `'burn'` blend, clipped to 0 without a `max()` call"""
+    if t > 0:
+        result = 1 - (1 - b) / t
+        return result if result >= 0.0 else 0.0
+    return 0.0
+
+
+def _blend_dodge(b: float, t: float) -> float:
+    """Scalar `'dodge'` blend, clipped to 1 without a `min()` call"""
+    if t < 1:
+        result = b / (1 - t)
+        return result if result <= 1.0 else 1.0
+    return 1.0
+
+
+# per-channel blend operations, bottom layer (b) and top layer (t).  See
+# DynamicColor.blend for a description of each mode.  Clipping is done with
+# conditional expressions, which are much cheaper than builtin min()/max()
+# calls for two floats.
+BLEND_MODES = {
+    "add": _blend_add,
+    "subtract": _blend_subtract,
+    "difference": lambda b, t: abs(b-t),
+    "multiply": _blend_multiply,
+    "divide": _blend_divide,
+    "burn": _blend_burn,
+    "dodge": _blend_dodge,
+    "screen": lambda b, t: 1-(1-b)*(1-t),
+    "overlay": lambda b, t: 2*b*t if b < 0.5 else 1-2*(1-b)*(1-t),
+    "hard light": lambda b, t: 2*b*t if t < 0.5 else 1-2*(1-b)*(1-t),
+    "soft light": lambda b, t: (1-2*t)*b**2 + 2*t*b,
+    "darken": min,
+    "lighten": max
+}
+_BLEND_MODES_STR = str(list(BLEND_MODES))  # for error messages
+_REDMEAN_DENOM = 1 + 1/255  # 256/255, rescales redmean weights to [0, 1]
+
+
+def _masked_divide(
+    num: np.ndarray,
+    denom: np.ndarray,
+    mask: np.ndarray,
+    fill: float,
+    upper: float) -> np.ndarray:
+    """Compute `min(num / denom, upper)` wherever `mask` is set and `fill`
+    elsewhere, without evaluating the division outside of `mask`.
+    """
+    out = np.full(np.broadcast(num, denom).shape, fill)
+    np.divide(num, denom, out=out, where=mask)
+    return np.minimum(out, upper, out=out)
+
+
+def _masked_burn(bottom: np.ndarray, top: np.ndarray) -> np.ndarray:
+    """Array version of the `'burn'` blend mode, dividing only where
+    `top > 0`.
+    """
+    mask = top > 0
+    out = np.zeros(np.broadcast(bottom, top).shape)
+    np.divide(1 - bottom, top, out=out, where=mask)
+    np.subtract(1.0, out, out=out, where=mask)
+    return np.maximum(out, 0.0, out=out)
+
+
+# array equivalents of BLEND_MODES, for blending many colors at once
+_ARRAY_BLEND_MODES = {
+    "add": lambda b, t: np.minimum(b+t, 1.0),
+    "subtract": lambda b, t: np.maximum(b-t, 0.0),
+    "difference": lambda b, t: np.abs(b-t),
+    "multiply": lambda b, t: b*t,
+    "divide": lambda b, t: _masked_divide(b, t, t > 0, 1.0, 1.0),
+    "burn": lambda b, t: _masked_burn(b, t),
+    "dodge": lambda b, t: _masked_divide(b, 1-t, t < 1, 1.0, 1.0),
+    "screen": lambda b, t: 1-(1-b)*(1-t),
+    "overlay": lambda b, t: np.where(b < 0.5, 2*b*t, 1-2*(1-b)*(1-t)),
+    "hard light": lambda b, t: np.where(t < 0.5, 2*b*t, 1-2*(1-b)*(1-t)),
+    "soft light": lambda b, t: (1-2*t)*b*b + 2*t*b,
+    "darken": np.minimum,
+    "lighten": np.maximum
+}
+
+
+def blend_arrays(
+    bottom: np.ndarray,
+    top: np.ndarray,
+    mode: str = "overlay") -> np.ndarray:
+    """Blend arrays of color values in a single vectorized pass, using the
+    same blend modes as :meth:`~curvefit.color.DynamicColor.blend`.
+
+    `bottom` and `top` are treated channel-wise, so any pair of broadcastable
+    arrays with values in `[0, 1]` is accepted, including `(N, 3)` rows of
+    RGB colors and channel-major `(3, N)` layouts.
+
+    :param bottom: color values for the bottom layer
+    :type bottom: np.ndarray
+    :param top: color values for the top layer
+    :type top: np.ndarray
+    :param mode: blend mode to use, defaults to "overlay"
+    :type mode: str, optional
+    :raises ValueError: if `mode` isn't one of the allowed values
+    :return: an array of blended color values, with the broadcast shape of
+        `bottom` and `top`
+    :rtype: np.ndarray
+    """
+    blend_func = _ARRAY_BLEND_MODES.get(mode)
+    if blend_func is None:
+        err_msg = (f"[{error_trace()}] `mode` must be a string with one of "
+                   f"the following values: {_BLEND_MODES_STR} (received: "
+                   f"{repr(mode)})")
+        raise ValueError(err_msg)
+    bottom = np.asarray(bottom, dtype=float)
+    top = np.asarray(top, dtype=float)
+    return blend_func(bottom, top)
 
 
 class DynamicColor:
@@ -168,6 +350,10 @@ class DynamicColor:
 
     callback_properties = {"alpha", "hex_code", "hsv", "name", "rgb", "rgba"}
 
+    # callback_property keeps its per-instance state in weak-keyed
+    # containers, so instances must remain weak-referenceable
+    __slots__ = ("_rgba", "__weakref__")
+
     def __init__(self,
                  color: str | tuple[NUMERIC, ...],
                  alpha: NUMERIC | None = None,
@@ -210,7 +396,8 @@ class DynamicColor:
             err_msg = (f"[{error_trace(self)}] `alpha` must be a numeric "
                        f"between 0 and 1 (received: {repr(new_alpha)})")
             raise ValueError(err_msg)
-        self._rgba = self._rgba[:3] + (new_alpha,)
+        red, green, blue, _ = self._rgba
+        self._rgba = (red, green, blue, new_alpha)
 
     @callback_property
     def hex_code(self) -> str:
@@ -298,8 +485,7 @@ class DynamicColor:
                        f"type: {type(new_hsv)})")
             raise TypeError(err_msg)
         if (len(new_hsv) != 3 or
-            any(not isinstance(v, NUMERIC_TYPECHECK) for v in new_hsv) or
-            any(not 0 <= v <= 1 for v in new_hsv)):
+            not _is_unit_tuple(new_hsv)):
             err_msg = (f"[{error_trace(self)}] `hsv` must be a length-3 tuple "
                        f"of numerics between 0 and 1 (received: "
                        f"{repr(new_hsv)})")
@@ -393,8 +579,7 @@ class DynamicColor:
                        f"type: {type(new_rgb)})")
             raise TypeError(err_msg)
         if (len(new_rgb) != 3 or
-            any(not isinstance(v, NUMERIC_TYPECHECK) for v in new_rgb) or
-            any(not 0 <= v <= 1 for v in new_rgb)):
+            not _is_unit_tuple(new_rgb)):
             err_msg = (f"[{error_trace(self)}] `rgb` must be a length-3 tuple "
                        f"of numerics between 0 and 1 (received: "
                        f"{repr(new_rgb)})")
@@ -442,8 +627,7 @@ class DynamicColor:
                        f"of type: {type(new_rgba)})")
             raise TypeError(err_msg)
         if (len(new_rgba) != 4 or
-            any(not isinstance(v, NUMERIC_TYPECHECK) for v in new_rgba) or
-            any(not 0 <= v <= 1 for v in new_rgba)):
+            not _is_unit_tuple(new_rgba)):
             err_msg = (f"[{error_trace(self)}] `rgba` must be a length-4 "
                        f"tuple of numerics between 0 and 1 (received: "
                        f"{repr(new_rgba)})")
@@ -526,33 +710,32 @@ class DynamicColor:
             If `in_place=True`, this is a reference to `self`.
         :rtype: DynamicColor
         """
-        blend_modes = {
-            "add": lambda b, t: min(b+t, 1.0),
-            "subtract": lambda b, t: max(b-t, 0.0),
-            "difference": lambda b, t: abs(b-t),
-            "multiply": lambda b, t: b*t,
-            "divide": lambda b, t: min(b/t, 1.0) if t > 0 else 1.0,
-            "burn": lambda b, t: max(1-(1-b)/t, 0.0) if t > 0 else 0.0,
-            "dodge": lambda b, t: min(b/(1-t), 1.0) if t < 1 else 1.0,
-            "screen": lambda b, t: 1-(1-b)*(1-t),
-            "overlay": lambda b, t: 2*b*t if b < 0.5 else 1-2*(1-b)*(1-t),
-            "hard light": lambda b, t: 2*b*t if t < 0.5 else 1-2*(1-b)*(1-t),
-            "soft light": lambda b, t: (1-2*t)*b**2 + 2*t*b,
-            "darken": min,
-            "lighten": max
-        }
-        if mode not in blend_modes:
+        blend_func = BLEND_MODES.get(mode)
+        if blend_func is None:
             err_msg = (f"[{error_trace(self)}] `mode` must be a string with "
-                       f"one of the following values: "
-                       f"{list(blend_modes.keys())} (received: "
-                       f"{repr(mode)})")
+                       f"one of the following values: {_BLEND_MODES_STR} "
+                       f"(received: {repr(mode)})")
             raise ValueError(err_msg)
+        return self._blend_with(color_like, blend_func, in_place=in_place,
+                                space=space)
+
+    def _blend_with(self,
+                    color_like: str | tuple[NUMERIC, ...] | DynamicColor,
+                    blend_func: Callable[[float, float], float],
+                    in_place: bool = False,
+                    space: str = "rgb") -> DynamicColor:
+        """Apply an already-resolved per-channel blend function.  This is
+        shared by :meth:`~curvefit.color.DynamicColor.blend` and the
+        arithmetic operators, which know their blend mode up front and skip
+        the mode lookup.
+        """
         try:
             other_rgb = to_rgba(color_like, space=space)[0:3]
         except ValueError as exc:
-            err_msg = f"[{error_trace(self)}] could not blend colors"
+            err_msg = (f"[{error_trace(self, stack_index=2)}] could not blend "
+                       f"colors")
             raise ValueError(err_msg) from exc
-        new_rgb = tuple(map(blend_modes[mode], self.rgb, other_rgb))
+        new_rgb = tuple(map(blend_func, self._rgba[:3], other_rgb))
         if in_place:
             self.rgb = new_rgb
             return self
@@ -596,18 +779,26 @@ class DynamicColor:
             objects
         :rtype: float
         """
-        try:
-            other_rgb = to_rgba(color_like, space=space)[:3]
-        except ValueError as exc:
-            err_msg = f"[{error_trace(self)}] could not compute distance"
-            raise ValueError(err_msg) from exc
-        squares = [(v1-v2)**2 for v1, v2 in zip(self.rgb, other_rgb)]
+        if isinstance(color_like, DynamicColor) and space == "rgb":
+            # already parsed, e.g. when maintaining contrast between colors
+            other_red, other_green, other_blue, _ = color_like._rgba
+        else:
+            try:
+                other_rgb = to_rgba(color_like, space=space)[:3]
+            except ValueError as exc:
+                err_msg = f"[{error_trace(self)}] could not compute distance"
+                raise ValueError(err_msg) from exc
+            other_red, other_green, other_blue = other_rgb
+        red, green, blue, _ = self._rgba
+        d_red = red - other_red
+        d_green = green - other_green
+        d_blue = blue - other_blue
         if weighted:
-            redmean = (self.rgb[0] + other_rgb[0]) / 2
-            denom = 1 + 1/255
-            factors = [2 + redmean/denom, 4, 2 + (1 - redmean)/denom]
-            return sqrt(sum([v1*v2 for v1, v2 in zip(factors, squares)]))
-        return sqrt(sum(squares))
+            redmean = (red + other_red) / 2
+            return sqrt((2 + redmean / _REDMEAN_DENOM) * d_red * d_red +
+                        4 * d_green * d_green +
+                        (2 + (1 - redmean) / _REDMEAN_DENOM) * d_blue * d_blue)
+        return sqrt(d_red * d_red + d_green * d_green + d_blue * d_blue)
 
     def invert(self, in_place: bool = False) -> DynamicColor:
         """Inverts the current DynamicColor's RGB values, returning a new
@@ -620,11 +811,15 @@ class DynamicColor:
             If `in_place=True`, this is a reference to `self`.
         :rtype: DynamicColor
         """
-        new_rgb = tuple(map(lambda v: 1 - v, self.rgb))
+        red, green, blue, _ = self._rgba
+        new_rgb = (1 - red, 1 - green, 1 - blue)
         if in_place:
             self.rgb = new_rgb
             return self
-        return DynamicColor(new_rgb)
+        # the inverse of a valid color is always valid, so skip re-parsing
+        inverted = DynamicColor.__new__(DynamicColor)
+        inverted._rgba = new_rgb + (1.0,)
+        return inverted
 
     def parse(
         self,
@@ -651,13 +846,17 @@ class DynamicColor:
             their current settings.
         :rtype: dict[str, str | tuple[float, ...]]
         """
+        # read the underlying state once, rather than going through every
+        # property getter, and share the hex code between hex_code and name
+        rgba = self._rgba
+        hex_code = rgba_to_hex(rgba)
         prop_dict = {
-            "alpha": self.alpha,
-            "hex_code": self.hex_code,
-            "hsv": self.hsv,
-            "name": self.name,
-            "rgb": self.rgb,
-            "rgba": self.rgba
+            "alpha": rgba[-1],
+            "hex_code": hex_code,
+            "hsv": rgb_to_hsv(rgba[:3]),
+            "name": COLORS_NAMED.get(hex_code[:7], [None])[0],
+            "rgb": rgba[:3],
+            "rgba": rgba
         }
         return prop_dict
 
@@ -668,7 +867,15 @@ class DynamicColor:
         """An alias for :meth:`~curvefit.color.DynamicColor.blend` with
         `mode='add'`
         """
-        return self.blend(color_like, mode="add")
+        return self._blend_with(color_like, _blend_add)
+
+    def __copy__(self) -> DynamicColor:
+        """Copies the current color without re-parsing or re-validating it.
+        Callbacks are not copied.
+        """
+        duplicate = type(self).__new__(type(self))
+        duplicate._rgba = self._rgba
+        return duplicate
 
     def __eq__(
         self,
@@ -695,7 +902,7 @@ class DynamicColor:
         """An alias for :meth:`~curvefit.color.DynamicColor.blend` with
         `mode='multiply'`
         """
-        return self.blend(color_like, mode="multiply")
+        return self._blend_with(color_like, _blend_multiply)
 
     def __repr__(self) -> str:
         return f"DynamicColor({self.rgba})"
@@ -712,7 +919,7 @@ class DynamicColor:
         """An alias for :meth:`~curvefit.color.DynamicColor.blend` with
         `mode='subtract'`
         """
-        return self.blend(color_like, mode="subtract")
+        return self._blend_with(color_like, _blend_subtract)
 
     def __truediv__(
         self,
@@ -721,4 +928,4 @@ class DynamicColor:
         """An alias for :meth:`~curvefit.color.DynamicColor.blend` with
         `mode='divide'`
         """
-        return self.blend(color_like, mode="divide")
+        return self._blend_with(color_like, _blend_divide)
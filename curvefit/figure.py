@@ -1,7 +1,9 @@
 from __future__ import annotations
+from contextlib import contextmanager
 from math import ceil
 from pathlib import Path
-from typing import Optional, Union
+from typing import Iterator, Optional, Union
+import weakref
 
 import matplotlib as mpl
 from matplotlib.gridspec import GridSpec, SubplotSpec
@@ -23,7 +25,9 @@ TODO: Update DynamicFigure.Background in light of changes to DynamicRectangle
 class DynamicFigure:
 
     # DEFAULTS
-    observed_labels: set = set()
+    # live figures by label; entries drop out as figures are collected
+    _registry: weakref.WeakValueDictionary[str, DynamicFigure] = \
+        weakref.WeakValueDictionary()
     color_cutoff: float = 0.4  # invert text color below this difference cutoff
     horizontal_size_cutoff_medium: float = 6.4  # resize text below this width
     horizontal_size_cutoff_small: float = 3.2  #  ^
@@ -35,9 +39,9 @@ class DynamicFigure:
                  figure: plt.Figure = None,
                  background: bool = True,
                  **kwargs):
-        if label in self.observed_labels:
+        if label in self._registry:
             err_msg = (f"[DynamicFigure.__init__] `label` must be unique "
-                       f"(observed: {self.observed_labels}, received: "
+                       f"(observed: {set(self._registry)}, received: "
                        f"'{label}')")
             raise ValueError(err_msg)
         if figure is None:
@@ -45,36 +49,42 @@ class DynamicFigure:
         else:
             self.fig = figure
         self.label = label
-        self.observed_labels.add(self.label)
+        self._registry[self.label] = self
         self.fig.set_label(self.label)
-        self.fig.tight_layout()
-        for k, v in kwargs.items():
-            setattr(self, k, v)
-
-        # set up dynamic elements
-        self._grid = DynamicFigure.SubplotGrid(self)
-        children = self.fig.get_children()
-        if (len(children) == 0 or
-            not isinstance(children[0], mpl.patches.Rectangle)):
-            children_msg = "\n".join(children)
-            err_msg = (f"[DynamicFigure.background] unexpected error, figure "
-                       f"has no background rectangle: expected first index of "
-                       f"figure.get_children() to be an instance of "
-                       f"matplotlib.patches.Rectangle (observed children: "
-                       f"{children_msg})")
-            raise RuntimeError(err_msg)
-        self._background = DynamicFigure.Background(children[0], self)
-        if self.fig._suptitle is None:
-            self.fig.suptitle("")
-            self._title = DynamicText(self.fig._suptitle)
-            self._title.visible = False
-        else:
-            self._title = DynamicText(self.fig._suptitle)
+        self._suspend_layout = False
+        self._layout_pending = False
+
+        # dynamic elements are built on first access (see properties below)
+        self._background = None
+        self._grid = None
+        self._title = None
+        with self.batch_update():
+            self._tight_layout()
+            for k, v in kwargs.items():
+                setattr(self, k, v)
+
+    @classmethod
+    def observed_labels(cls) -> frozenset[str]:
+        """Return the labels of all live DynamicFigure instances."""
+        return frozenset(cls._registry)
 
     @property
     def background(self) -> DynamicFigure.Background:
         """Read-only accessor for self._background."""
-        # background rectangle is always the first element of get_children()
+        if self._background is None:
+            # background rectangle is always the first element of
+            # get_children()
+            children = self.fig.get_children()
+            if (len(children) == 0 or
+                not isinstance(children[0], mpl.patches.Rectangle)):
+                children_msg = "\n".join(map(str, children))
+                err_msg = (f"[DynamicFigure.background] unexpected error, "
+                           f"figure has no background rectangle: expected "
+                           f"first index of figure.get_children() to be an "
+                           f"instance of matplotlib.patches.Rectangle "
+                           f"(observed children: {children_msg})")
+                raise RuntimeError(err_msg)
+            self._background = DynamicFigure.Background(children[0], self)
         return self._background
 
     @background.setter
@@ -85,7 +95,7 @@ class DynamicFigure:
                        f"current background rectangle (received object of "
                        f"type: {type(has_background)})")
             raise TypeError(err_msg)
-        self._background.visible = has_background
+        self.background.visible = has_background
 
     # @property
     # def contents(self) -> list[DynamicAxes]:
@@ -122,15 +132,23 @@ class DynamicFigure:
             raise ValueError(err_msg)
         # resize elements of axes
         self.fig.set_figheight(new_height)
-        self.fig.tight_layout()
+        self._tight_layout()
 
     @property
     def subplot_grid(self) -> DynamicFigure.SubplotGrid:
+        if self._grid is None:
+            self._grid = DynamicFigure.SubplotGrid(self)
         return self._grid
 
     @property
     def title(self) -> DynamicText:
         """Read-only accessor for self._title."""
+        if self._title is None:
+            suptitle = self.fig._suptitle
+            if suptitle is None:
+                # hidden from the start, so that building it needs no relayout
+                suptitle = self.fig.suptitle("", visible=False)
+            self._title = DynamicText(suptitle)
         return self._title
 
     @title.setter
@@ -140,13 +158,16 @@ class DynamicFigure:
             err_msg = (f"[DynamicFigure.title] `title` must be either a "
                        f"string or None (received {type(new_title)})")
             raise TypeError(err_msg)
-        if not new_title:  # title is None or empty string
-            self._title.text = ""
-            self._title.visible = False
-        else:
-            self._title.text = new_title
-            self._title.visible = True
-        self.fig.tight_layout()
+        # the figure is laid out below, so the title needn't do it as well
+        title = self.title
+        with title.batch_update(relayout=False):
+            if not new_title:  # title is None or empty string
+                title.text = ""
+                title.visible = False
+            else:
+                title.text = new_title
+                title.visible = True
+        self._tight_layout()
 
     @property
     def width(self) -> float:
@@ -164,11 +185,39 @@ class DynamicFigure:
             raise ValueError(err_msg)
         # resize elements of axes
         self.fig.set_figwidth(new_width)
-        self.fig.tight_layout()
+        self._tight_layout()
+
+    @contextmanager
+    def batch_update(self) -> Iterator[DynamicFigure]:
+        """Context manager that defers figure relayouts until the end of the
+        block, so that resizing the figure, changing its title and/or
+        reshaping its subplot grid triggers at most one call to
+        ``tight_layout()``.  Nested blocks defer to the outermost one.
+
+        Properties set directly on :attr:`title` still lay out the figure
+        themselves; use :meth:`DynamicText.batch_update` to group those.
+        """
+        if self._suspend_layout:  # nested -> outermost block does the layout
+            yield self
+            return
+        self._suspend_layout = True
+        try:
+            yield self
+        finally:
+            self._suspend_layout = False
+            if self._layout_pending:
+                self._layout_pending = False
+                self.fig.tight_layout()
+
+    def _tight_layout(self) -> None:
+        if self._suspend_layout:
+            self._layout_pending = True
+        else:
+            self.fig.tight_layout()
 
     def save(self, save_to: Union[Path, str]) -> None:
         """Save this figure to given path."""
-        if not any(issubclass(type(save_to), t) for t in [Path, str]):
+        if not isinstance(save_to, (Path, str)):
             err_msg = (f"[DynamicFigure.save] `save_to` must be either a "
                        f"string or Path-like object")
             raise TypeError(err_msg)
@@ -220,15 +269,18 @@ class DynamicFigure:
         TODO: replace this with callback system
         """
 
+        # every color property except alpha, which doesn't affect contrast
+        _contrast_props = tuple(p for p in DynamicColor.callback_properties
+                                if p != "alpha")
+
         def __init__(self,
                      rect_obj: mpl.patches.Rectangle,
                      parent: DynamicFigure,
                      **kwargs):
             super().__init__(rect_obj, **kwargs)
             self.parent = parent
-            callback_props = DynamicColor.callback_properties
-            minus_alpha = tuple(p for p in callback_props if p != "alpha")
-            add_callback(self.face.color, minus_alpha, self.maintain_contrast)
+            add_callback(self.face.color, self._contrast_props,
+                         self.maintain_contrast)
             # add_callback(self.parent.title.color, minus_alpha,
             #                                      self.maintain_contrast)
 
@@ -323,7 +375,7 @@ class DynamicFigure:
                 for index, ax in enumerate(self.parent.fig.axes):
                     new_sps = SubplotSpec(self.gridspec, index)
                     ax.set_subplotspec(new_sps)
-                self.parent.fig.tight_layout()
+                self.parent._tight_layout()
 
         @property
         def rows(self) -> int:
@@ -350,7 +402,7 @@ class DynamicFigure:
                 for index, ax in enumerate(self.parent.fig.axes):
                     new_sps = SubplotSpec(self.gridspec, index)
                     ax.set_subplotspec(new_sps)
-                self.parent.fig.tight_layout()
+                self.parent._tight_layout()
 
         @property
         def shape(self) -> tuple[int, int]:
@@ -366,7 +418,8 @@ class DynamicFigure:
                            f"`(n_rows, n_columns)`")
                 raise TypeError(err_msg)
             if (len(new_shape) != 2 or
-                not all(isinstance(i, int) for i in new_shape)):
+                not (isinstance(new_shape[0], int) and
+                     isinstance(new_shape[1], int))):
                 err_msg = (f"[DynamicFigure.SubplotGrid.shape] `shape` must "
                            f"be a length 2 tuple of integers "
                            f"`(n_rows, n_columns)`")
@@ -15,10 +15,20 @@ TODO: change properties() to display these ^
 """
 
 
+# allowed values found at matplotlib.patches.Patch.set_linestyle/set_hatch
+_ALLOWED_LINESTYLES = frozenset({"-", "solid", "--", "dashed", "-.",
+                                 "dashdot", ":", "dotted", "none", "None",
+                                 " ", ""})
+_ALLOWED_HATCHES = frozenset({"/", "\\", "|", "-", "+", "x", "o", "O", ".",
+                              "*"})
+_ALLOWED_LINESTYLES_STR = str(set(_ALLOWED_LINESTYLES))
+_ALLOWED_HATCHES_STR = str(set(_ALLOWED_HATCHES))
+
+
 class DynamicPatch:
 
     def __init__(self, patch_obj: mpl.patches.Patch, **kwargs):
-        if not issubclass(type(patch_obj), mpl.patches.Patch):
+        if not isinstance(patch_obj, mpl.patches.Patch):
             err_msg = (f"[{error_trace(self)}] `patch_obj` must be an "
                        f"instance/subclass of matplotlib.patches.Patch "
                        f"(received  object of type: {type(patch_obj)})")
@@ -75,7 +85,7 @@ class DynamicPatch:
     class Border:
 
         def __init__(self, parent: DynamicPatch):
-            if not issubclass(type(parent), DynamicPatch):
+            if not isinstance(parent, DynamicPatch):
                 err_msg = (f"[{error_trace(self)}] `parent` must be an "
                            f"instance/subclass of DynamicPatch (received "
                            f"object of type: {type(parent)})")
@@ -110,19 +120,17 @@ class DynamicPatch:
 
         @style.setter
         def style(self, new_style: str) -> None:
-            # allowed values found at matplotlib.patches.Patch.set_linestyle
-            allowed = {"-", "solid", "--", "dashed", "-.", "dashdot", ":",
-                       "dotted", "none", "None", " ", ""}
             if not isinstance(new_style, str):
                 err_msg = (f"[{error_trace(self.parent, self)}] `style` must "
                            f"be a string with one of the following values: "
-                           f"{allowed} (received object of type: "
-                           f"{type(new_style)})")
+                           f"{_ALLOWED_LINESTYLES_STR} (received object of "
+                           f"type: {type(new_style)})")
                 raise TypeError(err_msg)
-            if new_style not in allowed:
+            if new_style not in _ALLOWED_LINESTYLES:
                 err_msg = (f"[{error_trace(self.parent, self)}] `style` must "
                            f"be a string with one of the following values: "
-                           f"{allowed} (received: {new_style})")
+                           f"{_ALLOWED_LINESTYLES_STR} (received: "
+                           f"{new_style})")
                 raise ValueError(err_msg)
             self.parent.obj.set_linestyle(new_style)
 
@@ -163,7 +171,7 @@ class DynamicPatch:
     class Face:
 
         def __init__(self, parent: DynamicPatch):
-            if not issubclass(type(parent), DynamicPatch):
+            if not isinstance(parent, DynamicPatch):
                 err_msg = (f"[{error_trace(self)}] `parent` must be an "
                            f"instance/subclass of DynamicPatch (received "
                            f"object of type: {type(parent)})")
@@ -215,17 +223,17 @@ class DynamicPatch:
 
             Only supported in the PostScript, PDF, SVG, and Agg backends.
             """
-            allowed = {"/", "\\", "|", "-", "+", "x", "o", "O", ".", "*"}
             if not isinstance(new_hatch, str):
                 err_msg = (f"[{error_trace(self.parent, self)}] `hatch` must "
                            f"be a string with one or more of the following "
-                           f"values: {allowed} (received object of type: "
-                           f"{type(new_hatch)})")
+                           f"values: {_ALLOWED_HATCHES_STR} (received object "
+                           f"of type: {type(new_hatch)})")
                 raise TypeError(err_msg)
-            if not all(v in allowed for v in new_hatch):
+            if not _ALLOWED_HATCHES.issuperset(new_hatch):
                 err_msg = (f"[{error_trace(self.parent, self)}] `hatch` must "
                            f"be a string with one or more of the following "
-                           f"values: {allowed} (received: {new_hatch})")
+                           f"values: {_ALLOWED_HATCHES_STR} (received: "
+                           f"{new_hatch})")
                 raise ValueError(err_msg)
             self.parent.obj.set_hatch(new_hatch)
 
@@ -267,9 +275,14 @@ class DynamicRectangle(DynamicPatch):
                        f"tuple `(x, y)` of numerics between 0 and 1 (received "
                        f"object of type: {type(new_anchor)})")
             raise TypeError(err_msg)
-        if (len(new_anchor) != 2 or
-            not all(isinstance(v, NUMERIC_TYPECHECK) for v in new_anchor) or
-            not all(0 <= v <= 1 for v in new_anchor)):
+        if len(new_anchor) == 2:
+            x, y = new_anchor
+            valid = (isinstance(x, NUMERIC_TYPECHECK) and
+                     isinstance(y, NUMERIC_TYPECHECK) and
+                     0 <= x <= 1 and 0 <= y <= 1)
+        else:
+            valid = False
+        if not valid:
             err_msg = (f"[{error_trace(self)}] `anchor` must be a length 2 "
                        f"tuple `(x, y)` of numerics between 0 and 1 "
                        f"(received: {new_anchor})")
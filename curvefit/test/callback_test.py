@@ -27,14 +27,17 @@ class TestClass:
         self.triggered = True
 
 
+_PROP_NAMES = tuple(name for name, val in vars(TestClass).items()
+                    if isinstance(val, CallbackProperty))
+
+
 class BasicCallbackPropertyTests(unittest.TestCase):
 
     def test_callback_property_docstring(self):
-        test = TestClass()
-        get_prop = lambda prop_name: getattr(type(test), prop_name)
-        self.assertEqual(get_prop("foo").__doc__, "naked callback property")
-        self.assertEqual(get_prop("bar").__doc__, "getter for bar")
-        self.assertEqual(get_prop("baz").__doc__, "getter for baz")
+        # class-level access returns the CallbackProperty itself
+        self.assertEqual(TestClass.foo.__doc__, "naked callback property")
+        self.assertEqual(TestClass.bar.__doc__, "getter for bar")
+        self.assertEqual(TestClass.baz.__doc__, "getter for baz")
 
     def test_list_callbacks_for_specific_property(self):
         def callback1(instance):
@@ -44,13 +47,15 @@ class BasicCallbackPropertyTests(unittest.TestCase):
             pass
         
         test = TestClass()
-        self.assertEqual(callbacks(test, "foo"), [])
+        self.assertEqual(callbacks(test, "foo"), ())
         add_callback(test, "foo", callback1)
-        self.assertEqual(callbacks(test, "foo"), [callback1])
+        self.assertEqual(callbacks(test, "foo"), (callback1,))
         add_callback(test, "foo", callback2)
-        self.assertEqual(callbacks(test, "foo"), [callback1, callback2])
-        callbacks(test, "foo").remove(callback1)  # not propagated
-        self.assertEqual(callbacks(test, "foo"), [callback1, callback2])
+        self.assertEqual(callbacks(test, "foo"), (callback1, callback2))
+        snapshot = callbacks(test, "foo")
+        remove_callback(test, "foo", callback1)
+        self.assertEqual(snapshot, (callback1, callback2))  # not a live view
+        self.assertEqual(callbacks(test, "foo"), (callback2,))
 
     def test_list_callbacks_for_entire_instance(self):
         def callback1(instance):
@@ -60,13 +65,14 @@ class BasicCallbackPropertyTests(unittest.TestCase):
             pass
 
         test = TestClass()
-        expected = {"foo": [], "bar": [], "baz": []}
+        expected = {prop_name: () for prop_name in _PROP_NAMES}
         self.assertEqual(callbacks(test), expected)
         add_callback(test, "foo", callback1)
-        expected = {"foo": [callback1], "bar": [], "baz": []}
+        expected["foo"] = (callback1,)
         self.assertEqual(callbacks(test), expected)
         add_callback(test, ("foo", "bar"), callback2)
-        expected = {"foo": [callback1, callback2], "bar": [callback2], "baz": []}
+        expected["foo"] = (callback1, callback2)
+        expected["bar"] = (callback2,)
         self.assertEqual(callbacks(test), expected)
 
     def test_copy_callbacks(self):
@@ -76,9 +82,9 @@ class BasicCallbackPropertyTests(unittest.TestCase):
         old_instance = TestClass()
         add_callback(old_instance, "foo", callback)
         new_instance = TestClass()
-        self.assertEqual(callbacks(new_instance, "foo"), [])
+        self.assertEqual(callbacks(new_instance, "foo"), ())
         copy_callbacks(old_instance, new_instance)
-        self.assertEqual(callbacks(new_instance, "foo"), [callback])
+        self.assertEqual(callbacks(new_instance, "foo"), (callback,))
         new_instance.foo = "def"
         self.assertTrue(new_instance.triggered)
 
@@ -93,7 +99,7 @@ class AddCallbackTests(unittest.TestCase):
         test = TestClass()
         self.assertFalse(test.triggered)
         add_callback(test, "foo", callback_function)
-        self.assertEqual(callbacks(test, "foo"), [callback_function])
+        self.assertEqual(callbacks(test, "foo"), (callback_function,))
         test.foo = "abc"  # no state change
         self.assertFalse(test.triggered)  # no callback
         test.foo = "def"
@@ -103,20 +109,17 @@ class AddCallbackTests(unittest.TestCase):
         test.triggered = False
         self.assertFalse(test.triggered)
         add_callback(test, "bar", callback_function)
-        self.assertEqual(callbacks(test, "bar"), [callback_function])
-        with self.assertRaises(AttributeError) as cm:
-            test.bar = "xyz"  # no state change
-            self.assertFalse(test.triggered)  # no callback
+        self.assertEqual(callbacks(test, "bar"), (callback_function,))
+        with self.assertRaisesRegex(AttributeError,
+                                    r"^CallbackProperty has no setter"):
             test.bar = "uvw"
-            self.assertTrue(test.triggered)
-        err_msg = "CallbackProperty has no setter"
-        self.assertEqual(str(cm.exception)[:len(err_msg)], err_msg)
+        self.assertFalse(test.triggered)  # no callback
 
         # baz - has setter
         test.triggered = False
         self.assertFalse(test.triggered)
         add_callback(test, "baz", callback_function)
-        self.assertEqual(callbacks(test, "baz"), [callback_function])
+        self.assertEqual(callbacks(test, "baz"), (callback_function,))
         test.baz = None  # no state change
         self.assertFalse(test.triggered)  # no callback
         test.baz = True
@@ -127,7 +130,7 @@ class AddCallbackTests(unittest.TestCase):
         test = TestClass()
         self.assertFalse(test.triggered)
         add_callback(test, "foo", test.callback_method)
-        self.assertEqual(callbacks(test, "foo"), [test.callback_method])
+        self.assertEqual(callbacks(test, "foo"), (test.callback_method,))
         test.foo = "abc"  # no state change
         self.assertFalse(test.triggered)  # no callback
         test.foo = "def"
@@ -137,20 +140,17 @@ class AddCallbackTests(unittest.TestCase):
         test.triggered = False
         self.assertFalse(test.triggered)
         add_callback(test, "bar", test.callback_method)
-        self.assertEqual(callbacks(test, "bar"), [test.callback_method])
-        with self.assertRaises(AttributeError) as cm:
-            test.bar = "xyz"  # no state change
-            self.assertFalse(test.triggered)  # no callback
+        self.assertEqual(callbacks(test, "bar"), (test.callback_method,))
+        with self.assertRaisesRegex(AttributeError,
+                                    r"^CallbackProperty has no setter"):
             test.bar = "uvw"
-            self.assertTrue(test.triggered)
-        err_msg = "CallbackProperty has no setter"
-        self.assertEqual(str(cm.exception)[:len(err_msg)], err_msg)
+        self.assertFalse(test.triggered)  # no callback
 
         # baz - has setter
         test.triggered = False
         self.assertFalse(test.triggered)
         add_callback(test, "baz", test.callback_method)
-        self.assertEqual(callbacks(test, "baz"), [test.callback_method])
+        self.assertEqual(callbacks(test, "baz"), (test.callback_method,))
         test.baz = None  # no state change
         self.assertFalse(test.triggered)  # no callback
         test.baz = True
@@ -159,9 +159,8 @@ class AddCallbackTests(unittest.TestCase):
     def test_add_callback_multiple_properties(self):
         test = TestClass()
         add_callback(test, ("foo", "bar", "baz"), test.callback_method)
-        expected = {"foo": [test.callback_method],
-                    "bar": [test.callback_method],
-                    "baz": [test.callback_method]}
+        expected = {prop_name: (test.callback_method,)
+                    for prop_name in _PROP_NAMES}
         self.assertEqual(callbacks(test), expected)
         self.assertFalse(test.triggered)
         test.foo = "def"
@@ -169,8 +168,7 @@ class AddCallbackTests(unittest.TestCase):
         test.triggered = False
         with self.assertRaises(AttributeError):  # bar has no setter
             test.bar = "uvw"
-            self.assertTrue(test.triggered)
-        test.triggered = False
+        self.assertFalse(test.triggered)
         test.baz = True
         self.assertTrue(test.triggered)
 
@@ -183,7 +181,7 @@ class AddCallbackTests(unittest.TestCase):
         
         test = TestClass()
         add_callback(test, "foo", (callback1, callback2))
-        self.assertEqual(callbacks(test, "foo"), [callback1, callback2])
+        self.assertEqual(callbacks(test, "foo"), (callback1, callback2))
         self.assertFalse(test.triggered)
         self.assertEqual(test.bar, "xyz")
         test.foo = "def"
@@ -199,8 +197,8 @@ class AddCallbackTests(unittest.TestCase):
         
         test = TestClass()
         add_callback(test, ("foo", "baz"), (callback1, callback2))
-        self.assertEqual(callbacks(test, "foo"), [callback1, callback2])
-        self.assertEqual(callbacks(test, "baz"), [callback1, callback2])
+        self.assertEqual(callbacks(test, "foo"), (callback1, callback2))
+        self.assertEqual(callbacks(test, "baz"), (callback1, callback2))
         self.assertFalse(test.triggered)
         self.assertEqual(test.bar, "xyz")
         test.foo = "def"
@@ -221,8 +219,8 @@ class AddCallbackTests(unittest.TestCase):
 
         test = TestClass()
         add_callback(test, {"foo": [callback1, callback2], "baz": callback1})
-        self.assertEqual(callbacks(test, "foo"), [callback1, callback2])
-        self.assertEqual(callbacks(test, "baz"), [callback1])
+        self.assertEqual(callbacks(test, "foo"), (callback1, callback2))
+        self.assertEqual(callbacks(test, "baz"), (callback1,))
         self.assertFalse(test.triggered)
         self.assertEqual(test.bar, "xyz")
         test.foo = "def"
@@ -243,35 +241,34 @@ class RemoveCallbackTests(unittest.TestCase):
 
         test = TestClass()
         add_callback(test, "foo", callback_function)
-        self.assertEqual(callbacks(test, "foo"), [callback_function])
+        self.assertEqual(callbacks(test, "foo"), (callback_function,))
         self.assertFalse(test.triggered)
         test.foo = "def"
         self.assertTrue(test.triggered)
         test.triggered = False
         remove_callback(test, "foo", callback_function)
-        self.assertEqual(callbacks(test, "foo"), [])
+        self.assertEqual(callbacks(test, "foo"), ())
         test.foo = "def"
         self.assertFalse(test.triggered)
 
     def test_remove_callback_method(self):
         test = TestClass()
         add_callback(test, "foo", test.callback_method)
-        self.assertEqual(callbacks(test, "foo"), [test.callback_method])
+        self.assertEqual(callbacks(test, "foo"), (test.callback_method,))
         self.assertFalse(test.triggered)
         test.foo = "def"
         self.assertTrue(test.triggered)
         test.triggered = False
         remove_callback(test, "foo", test.callback_method)
-        self.assertEqual(callbacks(test, "foo"), [])
+        self.assertEqual(callbacks(test, "foo"), ())
         test.foo = "def"
         self.assertFalse(test.triggered)
 
     def test_remove_callback_multiple_properties(self):
         test = TestClass()
         add_callback(test, ("foo", "bar", "baz"), test.callback_method)
-        expected = {"foo": [test.callback_method],
-                    "bar": [test.callback_method],
-                    "baz": [test.callback_method]}
+        expected = {prop_name: (test.callback_method,)
+                    for prop_name in _PROP_NAMES}
         self.assertEqual(callbacks(test), expected)
         self.assertFalse(test.triggered)
 
@@ -281,20 +278,20 @@ class RemoveCallbackTests(unittest.TestCase):
         test.triggered = False
         with self.assertRaises(AttributeError):  # bar has no setter
             test.bar = "uvw"
-            self.assertTrue(test.triggered)
-        test.triggered = False
+        self.assertFalse(test.triggered)
         test.baz = True
         self.assertTrue(test.triggered)
 
         # remove and confirm
         test.triggered = False
         remove_callback(test, ("foo", "bar", "baz"), test.callback_method)
-        self.assertEqual(callbacks(test), {"foo": [], "bar": [], "baz": []})
+        expected = {prop_name: () for prop_name in _PROP_NAMES}
+        self.assertEqual(callbacks(test), expected)
         test.foo = "ghi"
         self.assertFalse(test.triggered)
         with self.assertRaises(AttributeError):  # bar has no setter
             test.bar = "rst"
-            self.assertFalse(test.triggered)
+        self.assertFalse(test.triggered)
         test.baz = None
         self.assertFalse(test.triggered)
 
@@ -332,8 +329,8 @@ class RemoveCallbackTests(unittest.TestCase):
         # confirm callbacks work
         test = TestClass()
         add_callback(test, ("foo", "baz"), (callback1, callback2))
-        self.assertEqual(callbacks(test, "foo"), [callback1, callback2])
-        self.assertEqual(callbacks(test, "baz"), [callback1, callback2])
+        self.assertEqual(callbacks(test, "foo"), (callback1, callback2))
+        self.assertEqual(callbacks(test, "baz"), (callback1, callback2))
         self.assertFalse(test.triggered)
         self.assertEqual(test.bar, "xyz")
         test.foo = "def"
@@ -349,8 +346,8 @@ class RemoveCallbackTests(unittest.TestCase):
         test.triggered = False
         test._bar = "xyz"
         remove_callback(test, ("foo", "baz"), (callback1, callback2))
-        self.assertEqual(callbacks(test, "foo"), [])
-        self.assertEqual(callbacks(test, "baz"), [])
+        self.assertEqual(callbacks(test, "foo"), ())
+        self.assertEqual(callbacks(test, "baz"), ())
         test.foo = "ghi"
         self.assertFalse(test.triggered)
         self.assertEqual(test.bar, "xyz")
@@ -368,8 +365,8 @@ class RemoveCallbackTests(unittest.TestCase):
         # confirm callbacks work
         test = TestClass()
         add_callback(test, {"foo": [callback1, callback2], "baz": callback1})
-        self.assertEqual(callbacks(test, "foo"), [callback1, callback2])
-        self.assertEqual(callbacks(test, "baz"), [callback1])
+        self.assertEqual(callbacks(test, "foo"), (callback1, callback2))
+        self.assertEqual(callbacks(test, "baz"), (callback1,))
         self.assertFalse(test.triggered)
         self.assertEqual(test.bar, "xyz")
         test.foo = "def"
@@ -384,8 +381,8 @@ class RemoveCallbackTests(unittest.TestCase):
         # remove and confirm
         test.triggered = False
         remove_callback(test, {"foo": [callback1, callback2], "baz": callback1})
-        self.assertEqual(callbacks(test, "foo"), [])
-        self.assertEqual(callbacks(test, "baz"), [])
+        self.assertEqual(callbacks(test, "foo"), ())
+        self.assertEqual(callbacks(test, "baz"), ())
         test.foo = "ghi"
         self.assertFalse(test.triggered)
         self.assertEqual(test.bar, "xyz")
@@ -402,9 +399,9 @@ class ClearCallbackTests(unittest.TestCase):
 
         test = TestClass()
         add_callback(test, "foo", callback)
-        self.assertEqual(callbacks(test, "foo"), [callback])
+        self.assertEqual(callbacks(test, "foo"), (callback,))
         clear_callbacks(test, "foo")
-        self.assertEqual(callbacks(test, "foo"), [])
+        self.assertEqual(callbacks(test, "foo"), ())
 
     def test_clear_callbacks_multiple_properties(self):
         def callback(instance):
@@ -412,11 +409,11 @@ class ClearCallbackTests(unittest.TestCase):
 
         test = TestClass()
         add_callback(test, ("foo", "baz"), callback)
-        self.assertEqual(callbacks(test, "foo"), [callback])
-        self.assertEqual(callbacks(test, "baz"), [callback])
+        self.assertEqual(callbacks(test, "foo"), (callback,))
+        self.assertEqual(callbacks(test, "baz"), (callback,))
         clear_callbacks(test, "foo", "baz")
-        self.assertEqual(callbacks(test, "foo"), [])
-        self.assertEqual(callbacks(test, "baz"), [])
+        self.assertEqual(callbacks(test, "foo"), ())
+        self.assertEqual(callbacks(test, "baz"), ())
 
     def test_clear_callbacks_entire_instance(self):
         def callback(instance):
@@ -424,13 +421,13 @@ class ClearCallbackTests(unittest.TestCase):
 
         test = TestClass()
         add_callback(test, ("foo", "bar", "baz"), callback)
-        self.assertEqual(callbacks(test, "foo"), [callback])
-        self.assertEqual(callbacks(test, "bar"), [callback])
-        self.assertEqual(callbacks(test, "baz"), [callback])
+        self.assertEqual(callbacks(test, "foo"), (callback,))
+        self.assertEqual(callbacks(test, "bar"), (callback,))
+        self.assertEqual(callbacks(test, "baz"), (callback,))
         clear_callbacks(test)
-        self.assertEqual(callbacks(test, "foo"), [])
-        self.assertEqual(callbacks(test, "bar"), [])
-        self.assertEqual(callbacks(test, "baz"), [])
+        self.assertEqual(callbacks(test, "foo"), ())
+        self.assertEqual(callbacks(test, "bar"), ())
+        self.assertEqual(callbacks(test, "baz"), ())
 
 
 class ContextManagerTestCases(unittest.TestCase):
@@ -451,6 +448,21 @@ class ContextManagerTestCases(unittest.TestCase):
             test.foo = "stu"
         self.assertEqual(test.bar, 3)
 
+    def test_delay_callbacks_no_net_change(self):
+        def callback(instance):
+            instance._bar += 1
+
+        test = TestClass()
+        test._bar = 0
+        add_callback(test, ("foo", "baz"), callback)
+        with delay_callbacks(test):
+            test.foo = "def"
+            test.foo = "abc"  # restored to original value
+        self.assertEqual(test.bar, 0)
+        with delay_callbacks(test):
+            test.foo = "def"
+        self.assertEqual(test.bar, 1)  # baz was never assigned
+
     def test_delay_callbacks_whole_instance(self):
         def callback(instance):
             instance._bar += 1
@@ -468,6 +480,18 @@ class ContextManagerTestCases(unittest.TestCase):
             test.baz = "ghi"
         self.assertEqual(test.bar, 4)
 
+    def test_delay_callbacks_backing_state(self):
+        fired = []
+        test = TestClass()
+        test._bar = 0
+        add_callback(test, "bar", fired.append)  # bar has no setter
+        with delay_callbacks(test):
+            test._bar = 5  # changed without going through a setter
+        self.assertEqual(len(fired), 1)
+        with delay_callbacks(test, "bar"):
+            test._bar = 6
+        self.assertEqual(len(fired), 2)
+
     def test_delay_callbacks_nested(self):
         def callback(instance):
             instance._bar += 1
@@ -1,19 +1,75 @@
+import copy
 from functools import partial
+import math
+import os
 import random
 import unittest
 
 import numpy as np
 import matplotlib as mpl
 
-from curvefit.callback import add_callback
-from curvefit.color import COLORS_NAMED, DynamicColor, NAMED_COLORS
+from curvefit.callback import add_callback, delay_callbacks
+from curvefit.color import (blend_arrays, BLEND_MODES, COLORS_NAMED,
+                            COLORS_NAMED_KEYS, DynamicColor, NAMED_COLORS,
+                            NAMED_COLORS_KEYS)
 
 
-assert_equal_float = partial(np.testing.assert_almost_equal, decimal=3)
+# matplotlib reference conversions, bound once instead of looked up through
+# `mpl.colors` on every call
+_hsv_to_rgb = mpl.colors.hsv_to_rgb
+_rgb_to_hsv = mpl.colors.rgb_to_hsv
+
+assert_allclose_float = partial(np.testing.assert_allclose, rtol=0,
+                                atol=1.5e-3)  # same as assert_equal_float
+BYTE_FLOATS = np.arange(256) / 255  # 0 -> 0.0, 255 -> 1.0
+BYTE_FLOATS.setflags(write=False)
+
+# set CURVEFIT_FAST_TESTS to run coarser color sweeps during development
+SWEEP_SIZE = 32 if os.environ.get("CURVEFIT_FAST_TESTS") else 256
+
+
+def assert_equal_float(actual, desired) -> None:
+    """Check that `actual` and `desired` agree to 3 decimal places, using
+    `math.isclose` for scalars (skipping ndarray coercion) and one vectorized
+    `np.testing.assert_allclose` comparison for sequences.
+    """
+    if (isinstance(actual, (int, float)) and
+        isinstance(desired, (int, float))):
+        if not math.isclose(actual, desired, rel_tol=0, abs_tol=1.5e-3):
+            raise AssertionError(f"{actual!r} != {desired!r} to 3 decimal "
+                                 f"places")
+    else:
+        assert_allclose_float(actual, desired)
+
+
+def to_hex_batch(rgba_batch: np.ndarray) -> list[str]:
+    """Vectorized `mpl.colors.to_hex(..., keep_alpha=True)` over an (N, 3) or
+    (N, 4) array of rgb(a) values.  Missing alpha channels default to 1.
+    """
+    byte_batch = np.full((len(rgba_batch), 4), 255, dtype=np.uint8)
+    byte_batch[:, :rgba_batch.shape[1]] = np.round(rgba_batch * 255)
+    return ["#" + row.hex() for row in map(bytes, byte_batch)]
+
+
+def hex_to_rgba_batch(hex_codes: list[str]) -> np.ndarray:
+    """Vectorized `mpl.colors.to_rgba` over a list of `'#rrggbbaa'` hex codes,
+    decoded in a single pass through `BYTE_FLOATS`.
+    """
+    hex_digits = "".join(hex_code[1:] for hex_code in hex_codes)
+    byte_batch = np.frombuffer(bytes.fromhex(hex_digits), np.uint8)
+    return BYTE_FLOATS[byte_batch.reshape(-1, 4)]
 
 
 class DynamicColorBasicTests(unittest.TestCase):
 
+    @classmethod
+    def setUpClass(cls):
+        # shared, read-only fixtures.  Tests that mutate must copy them first
+        cls._red = DynamicColor((1, 0, 0, 1))
+        cls._green = DynamicColor((0, 1, 0))
+        cls._blue = DynamicColor((0, 0, 1))
+        cls._yellow = DynamicColor((1, 1, 0, 1))
+
     def test_basic_init_no_alpha(self):
         # hex code
         color = DynamicColor("#ff0000")  # pure red
@@ -223,28 +279,32 @@ class DynamicColorBasicTests(unittest.TestCase):
         with self.assertRaises(ValueError) as cm:
             color.parse(bad_color_type)
         err_msg = ("[DynamicColor.parse] could not parse color")
-        self.assertEqual(str(cm.exception)[:len(err_msg)], err_msg)
+        self.assertTrue(str(cm.exception).startswith(err_msg),
+                        msg=str(cm.exception))
 
         # bad_color_value
         with self.assertRaises(ValueError) as cm:
             color.parse(bad_color_value)
         err_msg = ("[DynamicColor.parse] could not parse color")
-        self.assertEqual(str(cm.exception)[:len(err_msg)], err_msg)
+        self.assertTrue(str(cm.exception).startswith(err_msg),
+                        msg=str(cm.exception))
 
         # bad_space_type
         with self.assertRaises(ValueError) as cm:
             color.parse((0.5, 0.5, 0.5), space=bad_space_type)
         err_msg = ("[DynamicColor.parse] could not parse color")
-        self.assertEqual(str(cm.exception)[:len(err_msg)], err_msg)
+        self.assertTrue(str(cm.exception).startswith(err_msg),
+                        msg=str(cm.exception))
 
         # bad_mode_value
         with self.assertRaises(ValueError) as cm:
             color.parse((0.5, 0.5, 0.5), space=bad_space_value)
         err_msg = ("[DynamicColor.parse] could not parse color")
-        self.assertEqual(str(cm.exception)[:len(err_msg)], err_msg)
+        self.assertTrue(str(cm.exception).startswith(err_msg),
+                        msg=str(cm.exception))
 
     def test_properties(self):
-        color = DynamicColor((1, 0, 0, 1))
+        color = self._red
         expected = {
             "alpha": 1.0,
             "hex_code": "#ff0000ff",
@@ -256,17 +316,32 @@ class DynamicColorBasicTests(unittest.TestCase):
         self.assertDictEqual(color.properties(), expected)
 
     def test_equality(self):
-        color = DynamicColor((0, 1, 0))
+        color = self._green
         self.assertEqual(color, DynamicColor((0, 1, 0)))
-        self.assertNotEqual(color, DynamicColor((1, 0, 0)))
+        self.assertNotEqual(color, self._red)
+
+    def test_copy(self):
+        color = self._blue
+        duplicate = copy.copy(color)
+        self.assertIsNot(duplicate, color)
+        self.assertEqual(duplicate.rgba, color.rgba)
+        duplicate.rgb = (1, 0, 0)  # does not affect original
+        assert_equal_float(color.rgb, (0.0, 0.0, 1.0))
+
+    def test_slots(self):
+        color = DynamicColor("red")
+        self.assertFalse(hasattr(color, "__dict__"))
+        self.assertEqual(copy.deepcopy(color).rgba, color.rgba)
 
     def test_hash(self):
-        color1 = DynamicColor((0, 0, 1))
-        color2 = DynamicColor((0, 0, 1))
+        color1 = self._blue
+        color2 = DynamicColor((0, 0, 1))  # built independently, equal value
+        self.assertEqual(color1, color2)
         self.assertNotEqual(hash(color1), hash(color2))
+        self.assertNotEqual(hash(color1), hash(copy.copy(color1)))
 
     def test_repr(self):
-        color = DynamicColor((1, 1, 0, 1))
+        color = self._yellow
         self.assertEqual(repr(color), "DynamicColor((1, 1, 0, 1))")
 
     def test_str(self):
@@ -278,561 +353,336 @@ class DynamicColorBasicTests(unittest.TestCase):
 
 class DynamicColorCallbackTests(unittest.TestCase):
 
-    def test_alpha_callback(self):
+    def _assert_callback_on_change(self, initial, attr: str, unchanged,
+                                   changed, sentinel, **kwargs):
+        """Attach a callback that sets `color.<attr> = sentinel`, then check
+        that it fires only when `<attr>` actually changes state.
+        """
         def callback(color_instance):
-            color_instance.alpha = 0
+            setattr(color_instance, attr, sentinel)
+
+        assert_equal = (self.assertEqual if isinstance(unchanged, str)
+                        else assert_equal_float)
+        color = DynamicColor(initial, **kwargs)
+        add_callback(color, attr, callback)
+        assert_equal(getattr(color, attr), unchanged)
+        setattr(color, attr, unchanged)  # no state change
+        assert_equal(getattr(color, attr), unchanged)  # callback not invoked
+        setattr(color, attr, changed)  # state change
+        assert_equal(getattr(color, attr), sentinel)  # callback invoked
 
-        color = DynamicColor("white")
-        add_callback(color, "alpha", callback)
-        assert_equal_float(color.alpha, 1.0)
-        color.alpha = 1.0  # no state change
-        assert_equal_float(color.alpha, 1.0)  # callback not invoked
-        color.alpha = 0.5  # state change
-        assert_equal_float(color.alpha, 0.0)  # callback invoked
+    def test_alpha_callback(self):
+        self._assert_callback_on_change("white", "alpha", 1.0, 0.5, 0.0)
 
     def test_hex_code_callback(self):
-        def callback(color_instance):
-            color_instance.hex_code = "#000000ff"
-
-        color = DynamicColor("#ffffffff")
-        add_callback(color, "hex_code", callback)
-        self.assertEqual(color.hex_code, "#ffffffff")
-        color.hex_code = "#ffffffff"  # no state change
-        self.assertEqual(color.hex_code, "#ffffffff")  # callback not invoked
-        color.hex_code = "#ff0000ff"  # state change
-        self.assertEqual(color.hex_code, "#000000ff")  # callback invoked
+        self._assert_callback_on_change("#ffffffff", "hex_code", "#ffffffff",
+                                        "#ff0000ff", "#000000ff")
 
     def test_hsv_callback(self):
-        def callback(color_instance):
-            color_instance.hsv = (0, 0, 0)
-
-        color = DynamicColor((0, 0, 1), space="hsv")
-        add_callback(color, "hsv", callback)
-        assert_equal_float(color.hsv, (0.0, 0.0, 1.0))
-        color.hsv = (0.0, 0.0, 1.0)  # no state change
-        assert_equal_float(color.hsv, (0.0, 0.0, 1.0))  # callback not invoked
-        color.hsv = (0.0, 1.0, 1.0)  # state change
-        assert_equal_float(color.hsv, (0.0, 0.0, 0.0))  # callback invoked
+        self._assert_callback_on_change((0, 0, 1), "hsv", (0.0, 0.0, 1.0),
+                                        (0.0, 1.0, 1.0), (0.0, 0.0, 0.0),
+                                        space="hsv")
 
     def test_name_callback(self):
-        def callback(color_instance):
-            color_instance.name = "black"
-
-        color = DynamicColor("white")
-        add_callback(color, "name", callback)
-        self.assertEqual(color.name, "white")
-        color.name = "white"  # no state change
-        self.assertEqual(color.name, "white")  # callback not invoked
-        color.name = "red"  # state change
-        self.assertEqual(color.name, "black")  # callback invoked
+        self._assert_callback_on_change("white", "name", "white", "red",
+                                        "black")
 
     def test_rgb_callback(self):
-        def callback(color_instance):
-            color_instance.rgb = (0, 0, 0)
-
-        color = DynamicColor((1, 1, 1))
-        add_callback(color, "rgb", callback)
-        assert_equal_float(color.rgb, (1.0, 1.0, 1.0))
-        color.rgb = (1.0, 1.0, 1.0)  # no state change
-        assert_equal_float(color.rgb, (1.0, 1.0, 1.0))  # callback not invoked
-        color.rgb = (1.0, 0.0, 0.0)  # state change
-        assert_equal_float(color.rgb, (0.0, 0.0, 0.0))  # callback invoked
+        self._assert_callback_on_change((1, 1, 1), "rgb", (1.0, 1.0, 1.0),
+                                        (1.0, 0.0, 0.0), (0.0, 0.0, 0.0))
 
     def test_rgba_callback(self):
-        def callback(color_instance):
-            color_instance.rgba = (0, 0, 0, 0)
+        self._assert_callback_on_change((1, 1, 1, 1), "rgba",
+                                        (1.0, 1.0, 1.0, 1.0),
+                                        (1.0, 0.0, 0.0, 1.0),
+                                        (0.0, 0.0, 0.0, 0.0))
 
-        color = DynamicColor((1, 1, 1, 1))
-        add_callback(color, "rgba", callback)
-        assert_equal_float(color.rgba, (1.0, 1.0, 1.0, 1.0))
-        color.rgba = (1.0, 1.0, 1.0, 1.0)  # no state change
-        assert_equal_float(color.rgba, (1.0, 1.0, 1.0, 1.0))  # callback not invoked
-        color.rgba = (1.0, 0.0, 0.0, 1.0)  # state change
-        assert_equal_float(color.rgba, (0.0, 0.0, 0.0, 0.0))  # callback invoked
+    def test_delayed_derived_callbacks(self):
+        fired = []
+        color = DynamicColor("red")
+        add_callback(color, ("hex_code", "name", "rgba"), fired.append)
+        with delay_callbacks(color):
+            color.rgb = (0.0, 0.0, 1.0)  # changes each derived property
+        self.assertEqual(len(fired), 3)
+        with delay_callbacks(color):
+            pass  # nothing assigned
+        self.assertEqual(len(fired), 3)
+        with delay_callbacks(color, "hex_code", "name", "rgba"):
+            color.rgb = (0.0, 1.0, 0.0)  # rgb itself is not delayed
+        self.assertEqual(len(fired), 6)
 
 
 class DynamicColorSweepTests(unittest.TestCase):
 
-    def test_red_sweep(self):
-        starting_color = (0.0, 0.0, 0.0)
-        color = DynamicColor(starting_color)
-        if len(starting_color) == 4:
-            expected_alpha = starting_color[-1]
-        else:
-            expected_alpha = 1.0
-        for test_red in np.linspace(0, 1, num=256):
-            # get expected values:
-            expected_rgba = (test_red,) + starting_color[1:]
-            expected_hex = mpl.colors.to_hex(expected_rgba, keep_alpha=True)
-            expected_hsv = tuple(mpl.colors.rgb_to_hsv(expected_rgba[:3]))
-
-            # set and test:
-            color.rgb = expected_rgba[:3]
-            assert_equal_float(color.alpha, expected_alpha)
-            self.assertEqual(color.hex_code, expected_hex)
-            assert_equal_float(color.hsv, expected_hsv)
-            assert_equal_float(color.rgb, expected_rgba[:3])
-            if len(expected_rgba) == 4:
-                assert_equal_float(color.rgba, expected_rgba)
-            else:
-                assert_equal_float(color.rgba, expected_rgba + (1.0,))
-
-    def test_green_sweep(self):
-        starting_color = (0.0, 0.0, 0.0)
-        color = DynamicColor(starting_color)
-        if len(starting_color) == 4:
-            expected_alpha = starting_color[-1]
-        else:
-            expected_alpha = 1.0
-        for test_green in np.linspace(0, 1, num=256):
-            # get expected values:
-            expected_rgba = starting_color[:1] + (test_green,) + starting_color[2:]
-            expected_hex = mpl.colors.to_hex(expected_rgba, keep_alpha=True)
-            expected_hsv = tuple(mpl.colors.rgb_to_hsv(expected_rgba[:3]))
-
-            # set and test:
-            color.rgb = expected_rgba[:3]
-            assert_equal_float(color.alpha, expected_alpha)
-            self.assertEqual(color.hex_code, expected_hex)
-            assert_equal_float(color.hsv, expected_hsv)
-            assert_equal_float(color.rgb, expected_rgba[:3])
-            if len(expected_rgba) == 4:
-                assert_equal_float(color.rgba, expected_rgba)
-            else:
-                assert_equal_float(color.rgba, expected_rgba + (1.0,))
-
-    def test_blue_sweep(self):
-        starting_color = (0.0, 0.0, 0.0)
-        color = DynamicColor(starting_color)
-        if len(starting_color) == 4:
-            expected_alpha = starting_color[-1]
-        else:
-            expected_alpha = 1.0
-        for test_blue in np.linspace(0, 1, num=256):
-            # get expected values:
-            expected_rgba = starting_color[:2] + (test_blue,) + starting_color[3:]
-            expected_hex = mpl.colors.to_hex(expected_rgba, keep_alpha=True)
-            expected_hsv = tuple(mpl.colors.rgb_to_hsv(expected_rgba[:3]))
-
-            # set and test:
-            color.rgb = expected_rgba[:3]
-            assert_equal_float(color.alpha, expected_alpha)
-            self.assertEqual(color.hex_code, expected_hex)
-            assert_equal_float(color.hsv, expected_hsv)
-            assert_equal_float(color.rgb, expected_rgba[:3])
-            if len(expected_rgba) == 4:
-                assert_equal_float(color.rgba, expected_rgba)
-            else:
-                assert_equal_float(color.rgba, expected_rgba + (1.0,))
-
-    def test_alpha_sweep(self):
-        starting_color = (1.0, 1.0, 1.0, 0.0)
-        color = DynamicColor(starting_color)
-        for test_alpha in np.linspace(0, 1, num=256):
-            # get expected values:
-            expected_rgba = starting_color[:-1] + (test_alpha,)
-            expected_hex = mpl.colors.to_hex(expected_rgba, keep_alpha=True)
-            expected_hsv = tuple(mpl.colors.rgb_to_hsv(expected_rgba[:-1]))
-
-            # set and test:
-            color.alpha = test_alpha
-            assert_equal_float(color.alpha, test_alpha)
-            self.assertEqual(color.hex_code, expected_hex)
-            assert_equal_float(color.hsv, expected_hsv)
-            assert_equal_float(color.rgb, expected_rgba[:-1])
-            assert_equal_float(color.rgba, expected_rgba)
-
-    def test_hex_red_sweep(self):
-        starting_color = "#000000ff"
-        color = DynamicColor(starting_color)
-        for test_red in range(0, 255):
-            # get expected values:
-            hex_red = hex(test_red).split("x")[-1]
-            if len(hex_red) < 2:
-                hex_red = "0" + hex_red
-            expected_hex = f"#{hex_red}{starting_color[3:]}"
-            expected_rgba = mpl.colors.to_rgba(expected_hex)
-            expected_hsv = mpl.colors.rgb_to_hsv(expected_rgba[:3])
-
-            # set and test:
-            color.hex_code = expected_hex
-            assert_equal_float(color.alpha, expected_rgba[-1])
-            self.assertEqual(color.hex_code, expected_hex)
-            assert_equal_float(color.hsv, expected_hsv)
-            assert_equal_float(color.rgb, expected_rgba[:3])
-            assert_equal_float(color.rgba, expected_rgba)
-
-    def test_hex_green_sweep(self):
-        starting_color = "#000000ff"
-        color = DynamicColor(starting_color)
-        for test_green in range(0, 255):
-            # get expected values:
-            hex_green = hex(test_green).split("x")[-1]
-            if len(hex_green) < 2:
-                hex_green = "0" + hex_green
-            expected_hex = f"{starting_color[:3]}{hex_green}{starting_color[5:]}"
-            expected_rgba = mpl.colors.to_rgba(expected_hex)
-            expected_hsv = mpl.colors.rgb_to_hsv(expected_rgba[:3])
-
-            # set and test:
-            color.hex_code = expected_hex
-            assert_equal_float(color.alpha, expected_rgba[-1])
-            self.assertEqual(color.hex_code, expected_hex)
-            assert_equal_float(color.hsv, expected_hsv)
-            assert_equal_float(color.rgb, expected_rgba[:3])
-            assert_equal_float(color.rgba, expected_rgba)
-
-    def test_hex_blue_sweep(self):
-        starting_color = "#000000ff"
-        color = DynamicColor(starting_color)
-        for test_blue in range(0, 255):
-            # get expected values:
-            hex_blue = hex(test_blue).split("x")[-1]
-            if len(hex_blue) < 2:
-                hex_blue = "0" + hex_blue
-            expected_hex = f"{starting_color[:5]}{hex_blue}{starting_color[7:]}"
-            expected_rgba = mpl.colors.to_rgba(expected_hex)
-            expected_hsv = mpl.colors.rgb_to_hsv(expected_rgba[:3])
-
-            # set and test:
-            color.hex_code = expected_hex
-            assert_equal_float(color.alpha, expected_rgba[-1])
-            self.assertEqual(color.hex_code, expected_hex)
-            assert_equal_float(color.hsv, expected_hsv)
-            assert_equal_float(color.rgb, expected_rgba[:3])
-            assert_equal_float(color.rgba, expected_rgba)
-
-    def test_hex_alpha_sweep(self):
-        starting_color = "#ffffff00"
-        color = DynamicColor(starting_color)
-        for test_alpha in range(0, 255):
-            # get expected values:
-            hex_alpha = hex(test_alpha).split("x")[-1]
-            if len(hex_alpha) < 2:
-                hex_alpha = "0" + hex_alpha
-            expected_hex = f"{starting_color[:-2]}{hex_alpha}"
-            expected_rgba = mpl.colors.to_rgba(expected_hex)
-            expected_hsv = mpl.colors.rgb_to_hsv(expected_rgba[:3])
-
-            # set and test:
-            color.hex_code = expected_hex
-            assert_equal_float(color.alpha, expected_rgba[-1])
-            self.assertEqual(color.hex_code, expected_hex)
-            assert_equal_float(color.hsv, expected_hsv)
-            assert_equal_float(color.rgb, expected_rgba[:3])
-            assert_equal_float(color.rgba, expected_rgba)
-
-    def test_hue_sweep(self):
-        starting_color = (0.0, 1.0, 1.0)
-        color = DynamicColor(starting_color, space="hsv")
-        for test_hue in np.linspace(0, 1, num=256):
-            # get expected values:
-            expected_hsv = (test_hue % 1,) + starting_color[1:]
-            expected_rgb = tuple(mpl.colors.hsv_to_rgb(expected_hsv))
-            expected_hex = mpl.colors.to_hex(expected_rgb, keep_alpha=True)
-
-            # set and test:
-            color.hsv = expected_hsv
-            assert_equal_float(color.alpha, 1.0)
-            self.assertEqual(color.hex_code, expected_hex)
-            assert_equal_float(color.hsv, expected_hsv)
-            assert_equal_float(color.rgb, expected_rgb)
-            assert_equal_float(color.rgba, expected_rgb + (1.0,))
-
-    def test_saturation_sweep(self):
-        starting_color = (0.0, 0.0, 1.0)
-        color = DynamicColor(starting_color, space="hsv")
-        for test_sat in np.linspace(0, 1, num=256):
-            # get expected values:
-            expected_hsv = starting_color[:1] + (test_sat,) + starting_color[2:]
-            expected_rgb = tuple(mpl.colors.hsv_to_rgb(expected_hsv))
-            expected_hex = mpl.colors.to_hex(expected_rgb, keep_alpha=True)
-
-            # set and test:
-            color.hsv = expected_hsv
-            assert_equal_float(color.alpha, 1.0)
-            self.assertEqual(color.hex_code, expected_hex)
-            assert_equal_float(color.hsv, expected_hsv)
-            assert_equal_float(color.rgb, expected_rgb)
-            assert_equal_float(color.rgba, expected_rgb + (1.0,))
-
-    def test_value_sweep(self):
+    _SWEEP_VALUES = np.linspace(0, 1, num=SWEEP_SIZE)
+    _SWEEP_VALUES.setflags(write=False)  # shared between tests
+
+    @classmethod
+    def setUpClass(cls):
+        cls._proto_black = DynamicColor("#000000ff")
+        cls._proto_white = DynamicColor("#ffffffff")
+        cls._name_sample = random.Random(123).sample(NAMED_COLORS_KEYS, 32)
+        cls._hex_sample = random.Random(123).sample(COLORS_NAMED_KEYS, 32)
+
+    def _assert_sequence_equal(self, actual: list, expected: list):
+        """Compare a recorded batch of strings against its expected values.
+
+        A passing batch costs a single list comparison.  On failure, each
+        mismatched entry is reported in its own subTest, so the failing
+        sweep positions are still visible.
+        """
+        if actual == expected:
+            return
+        self.assertEqual(len(actual), len(expected))
+        for i, (actual_val, expected_val) in enumerate(zip(actual, expected)):
+            with self.subTest(i=i):
+                self.assertEqual(actual_val, expected_val)
+
+    def _assert_getters_match(self, color: DynamicColor, props: dict):
+        """Cross-check a `properties()` snapshot against the individual
+        property getters, which the sweeps otherwise never call.
+        """
+        self.assertEqual(props, {name: getattr(color, name) for name in props})
+
+    def _record(self, color: DynamicColor, attr: str,
+                values: list) -> dict[str, np.ndarray | list]:
+        """Assign each of `values` to `color.<attr>` in turn, recording every
+        property of `color` after each assignment.
+
+        Returns a dictionary mapping property names to their recorded values,
+        as lists for strings and arrays for everything else.
+        """
+        num = len(values)
+        recorded = {
+            "alpha": np.empty(num),
+            "hex_code": [],
+            "hsv": np.empty((num, 3)),
+            "name": [],
+            "rgb": np.empty((num, 3)),
+            "rgba": np.empty((num, 4))
+        }
+        actual_alpha = recorded["alpha"]
+        actual_hsv = recorded["hsv"]
+        actual_rgb = recorded["rgb"]
+        actual_rgba = recorded["rgba"]
+        record_hex = recorded["hex_code"].append
+        record_name = recorded["name"].append
+        properties = color.properties  # bound once, outside the loop
+        check_getters = self._assert_getters_match
+        for i, value in enumerate(values):
+            setattr(color, attr, value)
+            props = properties()
+            check_getters(color, props)
+            record_hex(props["hex_code"])
+            record_name(props["name"])
+            actual_alpha[i] = props["alpha"]
+            actual_hsv[i] = props["hsv"]
+            actual_rgb[i] = props["rgb"]
+            actual_rgba[i] = props["rgba"]
+        return recorded
+
+    def _assert_recorded(self,
+                         recorded: dict[str, np.ndarray | list],
+                         rgba_expected: np.ndarray,
+                         hsv_expected: np.ndarray,
+                         hex_expected: list[str],
+                         name_expected: list[str] | None = None):
+        """Check the output of `_record()` against the expected (N, 4) rgba
+        values, (N, 3) hsv values and hex codes of a sweep.
+        """
+        self._assert_sequence_equal(recorded["hex_code"], hex_expected)
+        if name_expected is not None:
+            self._assert_sequence_equal(recorded["name"], name_expected)
+        assert_allclose_float(recorded["alpha"], rgba_expected[:, 3])
+        assert_allclose_float(recorded["hsv"], hsv_expected)
+        assert_allclose_float(recorded["rgb"], rgba_expected[:, :3])
+        assert_allclose_float(recorded["rgba"], rgba_expected)
+
+    @staticmethod
+    def _opaque(rgb_batch: np.ndarray) -> np.ndarray:
+        """Append a fully-opaque alpha channel to an (N, 3) rgb batch."""
+        return np.column_stack((rgb_batch, np.ones(len(rgb_batch))))
+
+    def _rgb_channel_sweep(self, channel: int):
         starting_color = (0.0, 0.0, 0.0)
-        color = DynamicColor(starting_color, space="hsv")
-        for test_val in np.linspace(0, 1, num=256):
-            # get expected values:
-            expected_hsv = starting_color[:2] + (test_val,)
-            expected_rgb = tuple(mpl.colors.hsv_to_rgb(expected_hsv))
-            expected_hex = mpl.colors.to_hex(expected_rgb, keep_alpha=True)
-
-            # set and test:
-            color.hsv = expected_hsv
-            assert_equal_float(color.alpha, 1.0)
-            self.assertEqual(color.hex_code, expected_hex)
-            assert_equal_float(color.hsv, expected_hsv)
-            assert_equal_float(color.rgb, expected_rgb)
-            assert_equal_float(color.rgba, expected_rgb + (1.0,))
+        color = copy.copy(self._proto_black)
+        color.rgb = starting_color
 
-    def test_name_sweep(self):
-        def sample_dict(d: dict, size: int):
-            keys = random.sample(list(d), size)
-            values = [d[k] for k in keys]
-            return dict(zip(keys, values))
+        # get expected values:
+        rgb_batch = np.tile(starting_color, (SWEEP_SIZE, 1))
+        rgb_batch[:, channel] = self._SWEEP_VALUES
 
-        random.seed(123)
-        name_sample = sample_dict(NAMED_COLORS, size=32)
-        color = DynamicColor("white")
-        for name in name_sample:
-            # get expected values:
-            expected_hex = NAMED_COLORS[name] + "ff"
-            expected_rgb = mpl.colors.to_rgb(expected_hex)
-            expected_hsv = tuple(mpl.colors.rgb_to_hsv(expected_rgb))
-
-            # set and test:
-            color.name = name
-            assert_equal_float(color.alpha, 1.0)
-            self.assertEqual(color.hex_code, expected_hex)
-            assert_equal_float(color.hsv, expected_hsv)
-            assert_equal_float(color.rgb, expected_rgb)
-            assert_equal_float(color.rgba, expected_rgb + (1.0,))
+        # set, record and test:
+        recorded = self._record(color, "rgb",
+                                list(map(tuple, rgb_batch.tolist())))
+        self._assert_recorded(recorded, self._opaque(rgb_batch),
+                              _rgb_to_hsv(rgb_batch), to_hex_batch(rgb_batch))
 
-    def test_name_detection(self):
-        def sample_dict(d: dict, size: int):
-            keys = random.sample(list(d), size)
-            values = [d[k] for k in keys]
-            return dict(zip(keys, values))
+    def test_rgb_sweeps(self):
+        for channel, name in enumerate(("red", "green", "blue")):
+            with self.subTest(channel=name):
+                self._rgb_channel_sweep(channel)
 
-        random.seed(123)
-        hex_sample = sample_dict(COLORS_NAMED, size=32)
-        color = DynamicColor("white")
-        for hex_code in hex_sample:
-            # get expected values:
-            expected_name = COLORS_NAMED[hex_code][0]
-            expected_hex = hex_code + "ff"
-            expected_rgb = mpl.colors.to_rgb(expected_hex)
-            expected_hsv = tuple(mpl.colors.rgb_to_hsv(expected_rgb))
-
-            # set and test:
-            color.hex_code = hex_code
-            assert_equal_float(color.alpha, 1.0)
-            self.assertEqual(color.hex_code, expected_hex)
-            assert_equal_float(color.hsv, expected_hsv)
-            self.assertEqual(color.name, expected_name)
-            assert_equal_float(color.rgb, expected_rgb)
-            assert_equal_float(color.rgba, expected_rgb + (1.0,))
-
-
-class DynamicColorErrorTests(unittest.TestCase):
-
-    def test_alpha_errors(self):
-        bad_type = "1"
-        negative = -1
-        too_high = 1.5
-
-        # bad_type
-        color = DynamicColor("black")
-        with self.assertRaises(TypeError) as cm:
-            color.alpha = bad_type
-        err_msg = ("[DynamicColor.alpha] `alpha` must be a numeric between 0 "
-                   "and 1")
-        self.assertEqual(str(cm.exception)[:len(err_msg)], err_msg)
+    def test_alpha_sweep(self):
+        starting_color = (1.0, 1.0, 1.0, 0.0)
+        color = copy.copy(self._proto_white)
+        color.rgba = starting_color
+
+        # get expected values:
+        rgba_batch = np.tile(starting_color, (SWEEP_SIZE, 1))
+        rgba_batch[:, 3] = self._SWEEP_VALUES
+
+        # set, record and test:
+        recorded = self._record(color, "alpha", rgba_batch[:, 3].tolist())
+        self._assert_recorded(recorded, rgba_batch,
+                              _rgb_to_hsv(rgba_batch[:, :3]),
+                              to_hex_batch(rgba_batch))
+
+    def _hex_channel_sweep(self, starting_color: str, channel: int):
+        color = copy.copy(self._proto_black)
+        color.hex_code = starting_color
+
+        # get expected values:
+        prefix = starting_color[:1 + 2 * channel]
+        suffix = starting_color[3 + 2 * channel:]
+        channels = np.frombuffer(bytes.fromhex(starting_color[1:]), np.uint8)
+        rgba_table = np.tile(BYTE_FLOATS[channels], (256, 1))
+        rgba_table[:, channel] = BYTE_FLOATS
+        hsv_table = _rgb_to_hsv(rgba_table[:, :3])
+        test_values = np.linspace(0, 255, num=SWEEP_SIZE).round()
+        test_values = test_values.astype(np.uint8)  # includes 0 and 255
+        hex_pairs = test_values.tobytes().hex()  # 2 hex digits per value
+        hex_batch = [f"{prefix}{hex_pairs[i:i + 2]}{suffix}"
+                     for i in range(0, len(hex_pairs), 2)]
+
+        # set, record and test:
+        recorded = self._record(color, "hex_code", hex_batch)
+        self._assert_recorded(recorded, rgba_table[test_values],
+                              hsv_table[test_values], hex_batch)
+
+    def test_hex_sweeps(self):
+        sweeps = {
+            "red": ("#000000ff", 0),
+            "green": ("#000000ff", 1),
+            "blue": ("#000000ff", 2),
+            "alpha": ("#ffffff00", 3)
+        }
+        for name, (starting_color, channel) in sweeps.items():
+            with self.subTest(channel=name):
+                self._hex_channel_sweep(starting_color, channel)
+
+    def _hsv_channel_sweep(self,
+                           starting_color: tuple[float, float, float],
+                           channel: int):
+        color = copy.copy(self._proto_black)
+        color.hsv = starting_color
+
+        # get expected values:
+        hsv_batch = np.tile(starting_color, (SWEEP_SIZE, 1))
+        hsv_batch[:, channel] = self._SWEEP_VALUES
+        if channel == 0:  # hue wraps around
+            hsv_batch[:, channel] %= 1
+        rgb_batch = _hsv_to_rgb(hsv_batch)
+
+        # set, record and test:
+        recorded = self._record(color, "hsv",
+                                list(map(tuple, hsv_batch.tolist())))
+        self._assert_recorded(recorded, self._opaque(rgb_batch), hsv_batch,
+                              to_hex_batch(rgb_batch))
+
+    def test_hsv_sweeps(self):
+        sweeps = {
+            "hue": ((0.0, 1.0, 1.0), 0),
+            "saturation": ((0.0, 0.0, 1.0), 1),
+            "value": ((0.0, 0.0, 0.0), 2)
+        }
+        for name, (starting_color, channel) in sweeps.items():
+            with self.subTest(channel=name):
+                self._hsv_channel_sweep(starting_color, channel)
 
-        # negative
-        with self.assertRaises(ValueError) as cm:
-            color.alpha = negative
-        err_msg = ("[DynamicColor.alpha] `alpha` must be a numeric between 0 "
-                   "and 1")
-        self.assertEqual(str(cm.exception)[:len(err_msg)], err_msg)
+    def test_name_sweep(self):
+        name_sample = self._name_sample
+        color = copy.copy(self._proto_white)
 
-        # too_high
-        with self.assertRaises(ValueError) as cm:
-            color.alpha = too_high
-        err_msg = ("[DynamicColor.alpha] `alpha` must be a numeric between 0 "
-                   "and 1")
-        self.assertEqual(str(cm.exception)[:len(err_msg)], err_msg)
-
-    def test_hex_code_errors(self):
-        bad_type = 123456789  # length 9
-        no_hash = "ffffff"
-        bad_length = "#fffff"
-        bad_value = "#fffffg"
-
-        # bad_type
-        color = DynamicColor("#000000")
-        with self.assertRaises(TypeError) as cm:
-            color.hex_code = bad_type
-        err_msg = ("[DynamicColor.hex_code] `hex_code` must be a string of the "
-                   "form '#rrggbb' or '#rrggbbaa'")
-        self.assertEqual(str(cm.exception)[:len(err_msg)], err_msg)
-
-        # no_hash
-        with self.assertRaises(ValueError) as cm:
-            color.hex_code = no_hash
-        err_msg = ("[DynamicColor.hex_code] `hex_code` must be a string of the "
-                   "form '#rrggbb' or '#rrggbbaa'")
-        self.assertEqual(str(cm.exception)[:len(err_msg)], err_msg)
+        # get expected values:
+        hex_batch = [NAMED_COLORS[name] + "ff" for name in name_sample]
+        rgba_batch = hex_to_rgba_batch(hex_batch)
 
-        # bad_length
-        with self.assertRaises(ValueError) as cm:
-            color.hex_code = bad_length
-        err_msg = ("[DynamicColor.hex_code] `hex_code` must be a string of the "
-                   "form '#rrggbb' or '#rrggbbaa'")
-        self.assertEqual(str(cm.exception)[:len(err_msg)], err_msg)
+        # set, record and test:
+        recorded = self._record(color, "name", name_sample)
+        self._assert_recorded(recorded, rgba_batch,
+                              _rgb_to_hsv(rgba_batch[:, :3]), hex_batch)
 
-        # bad_value
-        with self.assertRaises(ValueError) as cm:
-            color.hex_code = bad_value
-        err_msg = ("[DynamicColor.hex_code] `hex_code` must be a string of the "
-                   "form '#rrggbb' or '#rrggbbaa'")
-        self.assertEqual(str(cm.exception)[:len(err_msg)], err_msg)
-
-    def test_hsv_errors(self):
-        bad_type = [1, 1, 1]
-        bad_length = (0, 0.0, 0, 1.0)
-        bad_val_type = (0.0, "0", 1)
-        negative = (0, -0.2, 0.5)
-        too_high = (1, 1.5, 0.5)
-
-        # bad_type
-        color = DynamicColor((0, 0, 0), space="hsv")
-        with self.assertRaises(TypeError) as cm:
-            color.hsv = bad_type
-        err_msg = ("[DynamicColor.hsv] `hsv` must be a length-3 tuple of "
-                   "numerics between 0 and 1")
-        self.assertEqual(str(cm.exception)[:len(err_msg)], err_msg)
-
-        # bad_length
-        with self.assertRaises(ValueError) as cm:
-            color.hsv = bad_length
-        err_msg = ("[DynamicColor.hsv] `hsv` must be a length-3 tuple of "
-                   "numerics between 0 and 1")
-        self.assertEqual(str(cm.exception)[:len(err_msg)], err_msg)
+    def test_name_detection(self):
+        hex_sample = self._hex_sample
+        color = copy.copy(self._proto_white)
 
-        # bad_val_type
-        with self.assertRaises(ValueError) as cm:
-            color.hsv = bad_val_type
-        err_msg = ("[DynamicColor.hsv] `hsv` must be a length-3 tuple of "
-                   "numerics between 0 and 1")
-        self.assertEqual(str(cm.exception)[:len(err_msg)], err_msg)
+        # get expected values:
+        hex_batch = [hex_code + "ff" for hex_code in hex_sample]
+        name_batch = [COLORS_NAMED[hex_code][0] for hex_code in hex_sample]
+        rgba_batch = hex_to_rgba_batch(hex_batch)
 
-        # negative
-        with self.assertRaises(ValueError) as cm:
-            color.hsv = negative
-        err_msg = ("[DynamicColor.hsv] `hsv` must be a length-3 tuple of "
-                   "numerics between 0 and 1")
-        self.assertEqual(str(cm.exception)[:len(err_msg)], err_msg)
+        # set, record and test:
+        recorded = self._record(color, "hex_code", hex_sample)
+        self._assert_recorded(recorded, rgba_batch,
+                              _rgb_to_hsv(rgba_batch[:, :3]), hex_batch,
+                              name_expected=name_batch)
 
-        # too_high
-        with self.assertRaises(ValueError) as cm:
-            color.hsv = too_high
-        err_msg = ("[DynamicColor.hsv] `hsv` must be a length-3 tuple of "
-                   "numerics between 0 and 1")
-        self.assertEqual(str(cm.exception)[:len(err_msg)], err_msg)
 
-    def test_named_color_errors(self):
-        bad_type = 24.0
-        not_recognized = "this is not a named color"
+class DynamicColorErrorTests(unittest.TestCase):
 
-        # bad_type
+    # expected error message prefixes, built once per class
+    _ALPHA_ERR = ("[DynamicColor.alpha] `alpha` must be a numeric between 0 "
+                  "and 1")
+    _HEX_CODE_ERR = ("[DynamicColor.hex_code] `hex_code` must be a string of "
+                     "the form '#rrggbb' or '#rrggbbaa'")
+    _HSV_ERR = ("[DynamicColor.hsv] `hsv` must be a length-3 tuple of "
+                "numerics between 0 and 1")
+    _NAME_ERR = ("[DynamicColor.name] `name` must be a string referencing a "
+                 "key in `NAMED_COLORS`")
+    _RGB_ERR = ("[DynamicColor.rgb] `rgb` must be a length-3 tuple of "
+                "numerics between 0 and 1")
+    _RGBA_ERR = ("[DynamicColor.rgba] `rgba` must be a length-4 tuple of "
+                 "numerics between 0 and 1")
+
+    # (attribute, bad value, expected error type, expected message prefix)
+    _ERROR_CASES = (
+        ("alpha", "1", TypeError, _ALPHA_ERR),  # bad_type
+        ("alpha", -1, ValueError, _ALPHA_ERR),  # negative
+        ("alpha", 1.5, ValueError, _ALPHA_ERR),  # too_high
+        ("hex_code", 123456789, TypeError, _HEX_CODE_ERR),  # bad_type
+        ("hex_code", "ffffff", ValueError, _HEX_CODE_ERR),  # no_hash
+        ("hex_code", "#fffff", ValueError, _HEX_CODE_ERR),  # bad_length
+        ("hex_code", "#fffffg", ValueError, _HEX_CODE_ERR),  # bad_value
+        ("hsv", [1, 1, 1], TypeError, _HSV_ERR),  # bad_type
+        ("hsv", (0, 0.0, 0, 1.0), ValueError, _HSV_ERR),  # bad_length
+        ("hsv", (0.0, "0", 1), ValueError, _HSV_ERR),  # bad_val_type
+        ("hsv", (0, -0.2, 0.5), ValueError, _HSV_ERR),  # negative
+        ("hsv", (1, 1.5, 0.5), ValueError, _HSV_ERR),  # too_high
+        ("name", 24.0, TypeError, _NAME_ERR),  # bad_type
+        ("name", "this is not a named color", ValueError,
+         _NAME_ERR),  # not_recognized
+        ("rgb", [1, 1, 1], TypeError, _RGB_ERR),  # bad_type
+        ("rgb", (0, 0.0, 0, 1.0), ValueError, _RGB_ERR),  # bad_length
+        ("rgb", (0.0, "0", 1), ValueError, _RGB_ERR),  # bad_val_type
+        ("rgb", (0, -0.2, 0.5), ValueError, _RGB_ERR),  # negative
+        ("rgb", (1, 1.5, 0.5), ValueError, _RGB_ERR),  # too_high
+        ("rgba", [1, 1, 1, 1], TypeError, _RGBA_ERR),  # bad_type
+        ("rgba", (0, 0.0, 0), ValueError, _RGBA_ERR),  # bad_length
+        ("rgba", (0.0, "0", 1, 0.2), ValueError, _RGBA_ERR),  # bad_val_type
+        ("rgba", (0, -0.2, 0.5, 1), ValueError, _RGBA_ERR),  # negative
+        ("rgba", (1, 1.5, 0.5, 0.8), ValueError, _RGBA_ERR)  # too_high
+    )
+
+    def test_setter_errors(self):
         color = DynamicColor("black")
-        with self.assertRaises(TypeError) as cm:
-            color.name = bad_type
-        err_msg = ("[DynamicColor.name] `name` must be a string referencing a "
-                   "key in `NAMED_COLORS`")
-        self.assertEqual(str(cm.exception)[:len(err_msg)], err_msg)
-
-        # not_recognized
-        with self.assertRaises(ValueError) as cm:
-            color.name = not_recognized
-        err_msg = ("[DynamicColor.name] `name` must be a string referencing a "
-                   "key in `NAMED_COLORS`")
-        self.assertEqual(str(cm.exception)[:len(err_msg)], err_msg)
-
-    def test_rgb_errors(self):
-        bad_type = [1, 1, 1]
-        bad_length = (0, 0.0, 0, 1.0)
-        bad_val_type = (0.0, "0", 1)
-        negative = (0, -0.2, 0.5)
-        too_high = (1, 1.5, 0.5)
-
-        # bad_type
-        color = DynamicColor((0, 0, 0))
-        with self.assertRaises(TypeError) as cm:
-            color.rgb = bad_type
-        err_msg = ("[DynamicColor.rgb] `rgb` must be a length-3 tuple of "
-                   "numerics between 0 and 1")
-        self.assertEqual(str(cm.exception)[:len(err_msg)], err_msg)
-
-        # bad_length
-        with self.assertRaises(ValueError) as cm:
-            color.rgb = bad_length
-        err_msg = ("[DynamicColor.rgb] `rgb` must be a length-3 tuple of "
-                   "numerics between 0 and 1")
-        self.assertEqual(str(cm.exception)[:len(err_msg)], err_msg)
-
-        # bad_val_type
-        with self.assertRaises(ValueError) as cm:
-            color.rgb = bad_val_type
-        err_msg = ("[DynamicColor.rgb] `rgb` must be a length-3 tuple of "
-                   "numerics between 0 and 1")
-        self.assertEqual(str(cm.exception)[:len(err_msg)], err_msg)
-
-        # negative
-        with self.assertRaises(ValueError) as cm:
-            color.rgb = negative
-        err_msg = ("[DynamicColor.rgb] `rgb` must be a length-3 tuple of "
-                   "numerics between 0 and 1")
-        self.assertEqual(str(cm.exception)[:len(err_msg)], err_msg)
-
-        # too_high
-        with self.assertRaises(ValueError) as cm:
-            color.rgb = too_high
-        err_msg = ("[DynamicColor.rgb] `rgb` must be a length-3 tuple of "
-                   "numerics between 0 and 1")
-        self.assertEqual(str(cm.exception)[:len(err_msg)], err_msg)
-
-    def test_rgba_errors(self):
-        bad_type = [1, 1, 1, 1]
-        bad_length = (0, 0.0, 0)
-        bad_val_type = (0.0, "0", 1, 0.2)
-        negative = (0, -0.2, 0.5, 1)
-        too_high = (1, 1.5, 0.5, 0.8)
-
-        # bad_type
-        color = DynamicColor((0, 0, 0, 1.0))
-        with self.assertRaises(TypeError) as cm:
-            color.rgba = bad_type
-        err_msg = ("[DynamicColor.rgba] `rgba` must be a length-4 tuple of "
-                   "numerics between 0 and 1")
-        self.assertEqual(str(cm.exception)[:len(err_msg)], err_msg)
-
-        # bad_length
-        with self.assertRaises(ValueError) as cm:
-            color.rgba = bad_length
-        err_msg = ("[DynamicColor.rgba] `rgba` must be a length-4 tuple of "
-                   "numerics between 0 and 1")
-        self.assertEqual(str(cm.exception)[:len(err_msg)], err_msg)
-
-        # bad_val_type
-        with self.assertRaises(ValueError) as cm:
-            color.rgba = bad_val_type
-        err_msg = ("[DynamicColor.rgba] `rgba` must be a length-4 tuple of "
-                   "numerics between 0 and 1")
-        self.assertEqual(str(cm.exception)[:len(err_msg)], err_msg)
-
-        # negative
-        with self.assertRaises(ValueError) as cm:
-            color.rgba = negative
-        err_msg = ("[DynamicColor.rgba] `rgba` must be a length-4 tuple of "
-                   "numerics between 0 and 1")
-        self.assertEqual(str(cm.exception)[:len(err_msg)], err_msg)
-
-        # too_high
-        with self.assertRaises(ValueError) as cm:
-            color.rgba = too_high
-        err_msg = ("[DynamicColor.rgba] `rgba` must be a length-4 tuple of "
-                   "numerics between 0 and 1")
-        self.assertEqual(str(cm.exception)[:len(err_msg)], err_msg)
+        for attr, bad_value, err_type, err_msg in self._ERROR_CASES:
+            with self.subTest(attr=attr, bad_value=bad_value):
+                with self.assertRaises(err_type) as cm:
+                    setattr(color, attr, bad_value)
+                self.assertTrue(str(cm.exception).startswith(err_msg),
+                                msg=str(cm.exception))
+        self.assertEqual(color.hex_code, "#000000ff")  # state unchanged
 
 
 class DynamicColorBlendTests(unittest.TestCase):
@@ -1061,27 +911,69 @@ class DynamicColorBlendTests(unittest.TestCase):
         with self.assertRaises(ValueError) as cm:
             color.blend(bad_color_type, mode="multiply")
         err_msg = ("[DynamicColor.blend] could not blend colors")
-        self.assertEqual(str(cm.exception)[:len(err_msg)], err_msg)
+        self.assertTrue(str(cm.exception).startswith(err_msg),
+                        msg=str(cm.exception))
 
         # bad_color_value
         with self.assertRaises(ValueError) as cm:
             color.blend(bad_color_value, mode="multiply")
         err_msg = ("[DynamicColor.blend] could not blend colors")
-        self.assertEqual(str(cm.exception)[:len(err_msg)], err_msg)
+        self.assertTrue(str(cm.exception).startswith(err_msg),
+                        msg=str(cm.exception))
 
         # bad_mode_type
         with self.assertRaises(ValueError) as cm:
             color.blend((0.5, 0.5, 0.5), mode=bad_mode_type)
         err_msg = ("[DynamicColor.blend] `mode` must be a string with one of "
                    "the following values:")
-        self.assertEqual(str(cm.exception)[:len(err_msg)], err_msg)
+        self.assertTrue(str(cm.exception).startswith(err_msg),
+                        msg=str(cm.exception))
 
         # bad_mode_value
         with self.assertRaises(ValueError) as cm:
             color.blend((0.5, 0.5, 0.5), mode=bad_mode_value)
         err_msg = ("[DynamicColor.blend] `mode` must be a string with one of "
                    "the following values:")
-        self.assertEqual(str(cm.exception)[:len(err_msg)], err_msg)
+        self.assertTrue(str(cm.exception).startswith(err_msg),
+                        msg=str(cm.exception))
+
+
+class DynamicColorBulkBlendTests(unittest.TestCase):
+
+    @classmethod
+    def setUpClass(cls):
+        rng = np.random.default_rng(123)
+        cls._bottom = rng.random((64, 3))
+        cls._top = rng.random((64, 3))
+        cls._top[:8] = (0.0, 1.0, 0.5)  # exercise divide/burn/dodge edges
+
+    def test_matches_scalar_blend(self):
+        for mode in BLEND_MODES:
+            with self.subTest(mode=mode):
+                expected = [DynamicColor(tuple(b)).blend(tuple(t), mode).rgb
+                            for b, t in zip(self._bottom.tolist(),
+                                            self._top.tolist())]
+                result = blend_arrays(self._bottom, self._top, mode)
+                assert_allclose_float(result, expected)
+
+    def test_channel_major_layout(self):
+        result = blend_arrays(self._bottom.T, self._top.T, "multiply")
+        assert_allclose_float(result.T, self._bottom * self._top)
+
+    def test_scalar_inputs(self):
+        for mode in BLEND_MODES:
+            with self.subTest(mode=mode):
+                expected = DynamicColor((0.5, 0.5, 0.5)).blend(
+                    (0.7, 0.7, 0.7), mode).rgb[0]
+                assert_allclose_float(blend_arrays(0.5, 0.7, mode), expected)
+
+    def test_bulk_blend_errors(self):
+        with self.assertRaises(ValueError) as cm:
+            blend_arrays(self._bottom, self._top, "fake_mode")
+        err_msg = ("[blend_arrays] `mode` must be a string with one of the "
+                   "following values:")
+        self.assertTrue(str(cm.exception).startswith(err_msg),
+                        msg=str(cm.exception))
 
 
 class DynamicColorDistanceTests(unittest.TestCase):
@@ -1105,13 +997,15 @@ class DynamicColorDistanceTests(unittest.TestCase):
         with self.assertRaises(ValueError) as cm:
             color.distance(bad_color_type)
         err_msg = ("[DynamicColor.distance] could not compute distance")
-        self.assertEqual(str(cm.exception)[:len(err_msg)], err_msg)
+        self.assertTrue(str(cm.exception).startswith(err_msg),
+                        msg=str(cm.exception))
 
         # bad_color_value
         with self.assertRaises(ValueError) as cm:
             color.distance(bad_color_value)
         err_msg = ("[DynamicColor.distance] could not compute distance")
-        self.assertEqual(str(cm.exception)[:len(err_msg)], err_msg)
+        self.assertTrue(str(cm.exception).startswith(err_msg),
+                        msg=str(cm.exception))
 
 
 class DynamicColorInversionTests(unittest.TestCase):
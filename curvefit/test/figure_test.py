@@ -0,0 +1,88 @@
+import gc
+import unittest
+from unittest import mock
+
+import matplotlib.pyplot as plt
+
+from curvefit.figure import DynamicFigure
+
+
+class DynamicFigureBasicTests(unittest.TestCase):
+
+    def tearDown(self):
+        plt.close("all")
+
+    def test_lazy_elements(self):
+        figure = DynamicFigure("lazy elements")
+        self.assertIsNone(figure._background)
+        self.assertIsNone(figure._grid)
+        self.assertIsNone(figure._title)
+        self.assertIsNone(figure.fig._suptitle)  # no hidden title added yet
+
+        # each element is built on first access, then reused
+        background = figure.background
+        self.assertIs(background.obj, figure.fig.get_children()[0])
+        self.assertIs(figure.background, background)
+        grid = figure.subplot_grid
+        self.assertIs(figure.subplot_grid, grid)
+        title = figure.title
+        self.assertIs(title.obj, figure.fig._suptitle)
+        self.assertFalse(title.visible)
+        self.assertEqual(title.text, "")
+        self.assertIs(figure.title, title)
+
+    def test_lazy_title_wraps_existing_suptitle(self):
+        fig = plt.figure()
+        fig.suptitle("existing")
+        figure = DynamicFigure("existing suptitle", figure=fig)
+        self.assertIs(figure.title.obj, fig._suptitle)
+        self.assertEqual(figure.title.text, "existing")
+        self.assertTrue(figure.title.visible)
+
+    def test_init_kwargs(self):
+        figure = DynamicFigure("init kwargs", title="test", width=5)
+        self.assertEqual(figure.title.text, "test")
+        self.assertTrue(figure.title.visible)
+        self.assertEqual(figure.width, 5)
+
+    def test_batch_update(self):
+        figure = DynamicFigure("batch update")
+        with mock.patch.object(figure.fig, "tight_layout") as layout:
+            with figure.batch_update():
+                figure.width = 5
+                figure.height = 3
+                figure.title = "test"
+                self.assertEqual(layout.call_count, 0)
+            self.assertEqual(layout.call_count, 1)  # one relayout, not three
+
+            with figure.batch_update():
+                with figure.batch_update():  # nested blocks are flattened
+                    figure.width = 4
+                self.assertEqual(layout.call_count, 1)
+            self.assertEqual(layout.call_count, 2)
+
+            with figure.batch_update():  # nothing changed -> no relayout
+                pass
+            self.assertEqual(layout.call_count, 2)
+
+            figure.height = 2  # outside a batch -> immediate relayout
+            self.assertEqual(layout.call_count, 3)
+
+    def test_label_registry(self):
+        figure = DynamicFigure("registry")
+        figure.title = "test"  # builds sub-objects that refer back to figure
+        self.assertIn("registry", DynamicFigure.observed_labels())
+        with self.assertRaises(ValueError) as cm:
+            DynamicFigure("registry")
+        err_msg = ("[DynamicFigure.__init__] `label` must be unique "
+                   "(observed: ")
+        self.assertTrue(str(cm.exception).startswith(err_msg),
+                        msg=str(cm.exception))
+
+        # labels are released once their figure is garbage collected
+        plt.close(figure.fig)
+        del figure
+        gc.collect()
+        self.assertNotIn("registry", DynamicFigure.observed_labels())
+        figure = DynamicFigure("registry")
+        self.assertEqual(figure.label, "registry")
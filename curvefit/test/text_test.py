@@ -1,23 +1,39 @@
 from functools import partial
+import glob
+import os
+import tempfile
 import unittest
+from unittest import mock
 
 import numpy as np
 from matplotlib.figure import Figure
 from matplotlib.text import Text
 
-from curvefit.callback import add_callback
+from curvefit.callback import add_callback, delay_callbacks
 from curvefit.color import DynamicColor, to_rgba
-from curvefit.text import DynamicText
+from curvefit.text import available_fonts, DynamicText
 
 
-assert_equal_float = partial(np.testing.assert_almost_equal, decimal=3)
+assert_equal_float = partial(np.testing.assert_allclose, rtol=0, atol=1.5e-3)
 
 
 class DynamicTextBasicTests(unittest.TestCase):
 
+    @classmethod
+    def setUpClass(cls):
+        # building a Figure is expensive, so share one across tests
+        cls._figure = Figure()
+
+    def setUp(self):
+        # give each test a fresh suptitle so no state leaks between tests
+        if self._figure._suptitle is not None:
+            self._figure._suptitle.remove()
+        self._figure.suptitle("test")
+
     def test_basic_init(self):
         text = DynamicText(Text(text="test"))
         self.assertEqual(text.text, "test")
+        self.assertFalse(hasattr(text, "__dict__"))  # uses __slots__
 
         # with kwargs
         text = DynamicText(Text(text="test"), alpha=0.8, color="white")
@@ -25,12 +41,79 @@ class DynamicTextBasicTests(unittest.TestCase):
         assert_equal_float(text.alpha, 0.8)
         self.assertEqual(text.color.name, "white")
 
+    def test_properties(self):
+        text = DynamicText(self._figure._suptitle)
+        props = text.properties()
+        self.assertEqual(list(props), ["alignment", "alpha", "color", "font",
+                                       "rotation", "line_spacing", "position",
+                                       "size", "text", "visible", "weight",
+                                       "wrap"])
+        self.assertEqual(props["text"], "test")
+        self.assertEqual(props["alignment"], ("center", "top"))
+
+        # properties() is a live, read-only view
+        snapshot = dict(props)
+        text.rotation = 30
+        self.assertEqual(props["rotation"], 30)
+        self.assertNotEqual(snapshot["rotation"], 30)
+        with self.assertRaises(KeyError):
+            props["obj"]
+        with self.assertRaises(TypeError):
+            props["rotation"] = 45
+
+        # __repr__ reports the same properties, in the same order
+        expected = ", ".join(f"{k}={v!r}" for k, v in props.items())
+        self.assertEqual(repr(text),
+                         f"DynamicText({text.obj!r}, {expected})")
+
+    def test_batch_update(self):
+        with mock.patch.object(self._figure, "tight_layout") as layout:
+            DynamicText(self._figure._suptitle, rotation=45, size=14,
+                        weight="bold", visible=True)
+            self.assertEqual(layout.call_count, 1)  # one relayout, not four
+
+            text = DynamicText(self._figure._suptitle)
+            with text.batch_update():
+                text.rotation = 0
+                with text.batch_update():  # nested blocks are flattened
+                    text.size = 12
+                self.assertEqual(layout.call_count, 1)
+            self.assertEqual(layout.call_count, 2)
+
+            text.rotation = 90  # outside a batch -> immediate relayout
+            self.assertEqual(layout.call_count, 3)
+
+            text.text = "changed"  # text changes never relayout
+            self.assertEqual(layout.call_count, 3)
+
+            with text.batch_update(relayout=False):  # caller lays out
+                text.rotation = 45
+            self.assertEqual(layout.call_count, 3)
+
+    def test_no_op_assignment_skips_layout(self):
+        text = DynamicText(self._figure._suptitle)
+        # matplotlib's default family ("sans-serif") is not a font name
+        text.font = sorted(available_fonts())[0]
+        with mock.patch.object(self._figure, "tight_layout") as layout:
+            for attr in ("alignment", "font", "line_spacing", "position",
+                         "rotation", "size", "visible", "weight", "wrap"):
+                with self.subTest(attr=attr):
+                    setattr(text, attr, getattr(text, attr))
+            text.alignment = text.alignment[0]  # horizontal only
+            text.alignment = text.alignment[1]  # vertical only
+            self.assertEqual(layout.call_count, 0)
+
+            # a batch made up only of no-ops does not relayout on exit
+            with text.batch_update():
+                text.size = text.size
+                text.weight = text.weight
+            self.assertEqual(layout.call_count, 0)
+
     def test_alignment(self):
-        figure = Figure()
-        figure.suptitle("test",
-                        horizontalalignment = "left",
-                        verticalalignment="baseline")
-        text = DynamicText(figure._suptitle)
+        self._figure.suptitle("test",
+                              horizontalalignment = "left",
+                              verticalalignment="baseline")
+        text = DynamicText(self._figure._suptitle)
         self.assertEqual(text.alignment, ("left", "baseline"))
         text.alignment = "center"
         self.assertEqual(text.alignment, ("center", "baseline"))
@@ -43,27 +126,31 @@ class DynamicTextBasicTests(unittest.TestCase):
         err_msg = ("[DynamicText.alignment] `alignment` must be a string or "
                    "tuple of strings `(horizontal, vertical)` with one of the "
                    "following horizontal values: ")
-        self.assertEqual(str(cm.exception)[:len(err_msg)], err_msg)
+        self.assertTrue(str(cm.exception).startswith(err_msg),
+                        msg=str(cm.exception))
 
         with self.assertRaises(ValueError) as cm:
             text.alignment = "bad alignment value"
         err_msg = ("[DynamicText.alignment] when given a string, `alignment` "
                    "must have one of the following values: ")
-        self.assertEqual(str(cm.exception)[:len(err_msg)], err_msg)
+        self.assertTrue(str(cm.exception).startswith(err_msg),
+                        msg=str(cm.exception))
 
         with self.assertRaises(ValueError) as cm:
             text.alignment = ("bad alignment value", "baseline")
         err_msg = ("[DynamicText.alignment] when given a tuple, the first "
                    "element of `alignment` must have one of the following "
                    "values: ")
-        self.assertEqual(str(cm.exception)[:len(err_msg)], err_msg)
+        self.assertTrue(str(cm.exception).startswith(err_msg),
+                        msg=str(cm.exception))
 
         with self.assertRaises(ValueError) as cm:
             text.alignment = ("left", "bad alignment value")
         err_msg = ("[DynamicText.alignment] when given a tuple, the second "
                    "element of `alignment` must have one of the following "
                    "values: ")
-        self.assertEqual(str(cm.exception)[:len(err_msg)], err_msg)
+        self.assertTrue(str(cm.exception).startswith(err_msg),
+                        msg=str(cm.exception))
 
         # test callbacks
         def callback(dynamic_text_instance):
@@ -79,31 +166,21 @@ class DynamicTextBasicTests(unittest.TestCase):
         self.assertEqual(text.alignment, ("right", "baseline"))  # callback
 
     def test_alpha(self):
-        figure = Figure()
-        figure.suptitle("test")
-        text = DynamicText(figure._suptitle)
+        text = DynamicText(self._figure._suptitle)
         assert_equal_float(text.alpha, 1.0)
         text.alpha = 0.5
         assert_equal_float(text.alpha, 0.5)
 
         # check errors
-        with self.assertRaises(TypeError) as cm:
-            text.alpha = "abc"
         err_msg = ("[DynamicColor.alpha] `alpha` must be a numeric "
                    "between 0 and 1")
-        self.assertEqual(str(cm.exception)[:len(err_msg)], err_msg)
-
-        with self.assertRaises(ValueError) as cm:
-            text.alpha = 1.2
-        err_msg = ("[DynamicColor.alpha] `alpha` must be a numeric "
-                   "between 0 and 1")
-        self.assertEqual(str(cm.exception)[:len(err_msg)], err_msg)
-
-        with self.assertRaises(ValueError) as cm:
-            text.alpha = -0.5
-        err_msg = ("[DynamicColor.alpha] `alpha` must be a numeric "
-                   "between 0 and 1")
-        self.assertEqual(str(cm.exception)[:len(err_msg)], err_msg)
+        for bad_alpha, err_type in (("abc", TypeError), (1.2, ValueError),
+                                    (-0.5, ValueError)):
+            with self.subTest(alpha=bad_alpha):
+                with self.assertRaises(err_type) as cm:
+                    text.alpha = bad_alpha
+                self.assertTrue(str(cm.exception).startswith(err_msg),
+                                msg=str(cm.exception))
 
         # test callbacks
         def callback(dynamic_text_instance):
@@ -116,11 +193,19 @@ class DynamicTextBasicTests(unittest.TestCase):
         text.alpha = 0.5  # state change
         self.assertEqual(text.alpha, 0.0)  # callback
 
+    def test_delayed_alpha_through_color(self):
+        fired = []
+        text = DynamicText(self._figure._suptitle)
+        add_callback(text, "alpha", fired.append)
+        with delay_callbacks(text):
+            text.color.alpha = 0.5  # bypasses DynamicText's alpha setter
+        assert_equal_float(text.alpha, 0.5)
+        self.assertEqual(len(fired), 1)
+
     def test_color(self):
-        figure = Figure()
-        figure.suptitle("test", color="black")
-        text = DynamicText(figure._suptitle)
+        text = DynamicText(self._figure._suptitle)
         assert_equal_float(text.color.rgb, (0, 0, 0))
+        self.assertIs(text.color, text.color)  # stored, not re-parsed
         text.color = "red"
         assert_equal_float(text.color.rgb, (1, 0, 0))
 
@@ -128,17 +213,16 @@ class DynamicTextBasicTests(unittest.TestCase):
         # with self.assertRaises(TypeError) as cm:
         #     text.color = {"color": "can't", "accept": "dicts"}
         # err_msg = ("[DynamicColor.parse] could not parse color")
-        # self.assertEqual(str(cm.exception)[:len(err_msg)], err_msg)
+        # self.assertTrue(str(cm.exception).startswith(err_msg),
+        #                 msg=str(cm.exception))
 
-        with self.assertRaises(ValueError) as cm:
-            text.color = (0, 1.3, 0.6)
         err_msg = ("[DynamicColor.parse] could not parse color")
-        self.assertEqual(str(cm.exception)[:len(err_msg)], err_msg)
-
-        with self.assertRaises(ValueError) as cm:
-            text.color = (0, -0.4, 0.2)
-        err_msg = ("[DynamicColor.parse] could not parse color")
-        self.assertEqual(str(cm.exception)[:len(err_msg)], err_msg)
+        for bad_color in ((0, 1.3, 0.6), (0, -0.4, 0.2)):
+            with self.subTest(color=bad_color):
+                with self.assertRaises(ValueError) as cm:
+                    text.color = bad_color
+                self.assertTrue(str(cm.exception).startswith(err_msg),
+                                msg=str(cm.exception))
 
         # test callbacks
         def callback(dynamic_text_instance):
@@ -150,3 +234,151 @@ class DynamicTextBasicTests(unittest.TestCase):
         assert_equal_float(text.color.rgb, (1, 1, 1))  # no callback
         text.color = "blue"  # state change
         assert_equal_float(text.color.rgb, (0, 0, 0))  # callback
+
+    def test_color_not_shared(self):
+        # texts with the same starting color must not share a DynamicColor
+        text1 = DynamicText(Text(text="a", color="red"))
+        text2 = DynamicText(Text(text="b", color="red"))
+        self.assertIsNot(text1.color, text2.color)
+        text1.color.rgb = (0, 0, 1)
+        self.assertEqual(text2.color.name, "red")
+        self.assertEqual(text2.obj.get_color(), "red")
+
+    def test_figure(self):
+        text = DynamicText(self._figure._suptitle)
+        self.assertIs(text.figure, self._figure)
+
+        # unattached text picks up its figure once it is added to one
+        text = DynamicText(Text(text="test"))
+        self.assertIsNone(text.figure)
+        figure = Figure()
+        figure.add_artist(text.obj)
+        self.assertIs(text.figure, figure)
+
+    def test_font(self):
+        text = DynamicText(self._figure._suptitle)
+        font = sorted(available_fonts())[0]
+        text.font = font
+        self.assertEqual(text.font, font)
+
+        # check errors
+        err_msg = ("[DynamicText.font] `font` must be a string referencing "
+                   "one of the available system fonts:")
+        for bad_font, err_type in ((12, TypeError),
+                                   ("not a real font", ValueError)):
+            with self.subTest(font=bad_font):
+                with self.assertRaises(err_type) as cm:
+                    text.font = bad_font
+                self.assertTrue(str(cm.exception).startswith(err_msg),
+                                msg=str(cm.exception))
+
+    def test_position(self):
+        text = DynamicText(self._figure._suptitle)
+        text.position = (0.25, 1)
+        assert_equal_float(text.position, (0.25, 1))
+
+        # check errors
+        with self.assertRaises(TypeError) as cm:
+            text.position = [0.5, 0.5]
+        err_msg = ("[DynamicText.position] `position` must be an `(x, y)` "
+                   "tuple of length 2 containing only numerics between 0 and "
+                   "1 (received object of type: ")
+        self.assertTrue(str(cm.exception).startswith(err_msg),
+                        msg=str(cm.exception))
+
+        err_msg = ("[DynamicText.position] `position` must be an `(x, y)` "
+                   "tuple of length 2 containing only numerics between 0 and "
+                   "1 (received: ")
+        for bad_position in ((0.5,), (0.5, 0.5, 0.5), (0.5, "0.5"),
+                             ("0.5", 0.5), (-0.1, 0.5), (0.5, 1.1)):
+            with self.subTest(position=bad_position):
+                with self.assertRaises(ValueError) as cm:
+                    text.position = bad_position
+                self.assertTrue(str(cm.exception).startswith(err_msg),
+                                msg=str(cm.exception))
+
+    def test_proxied_properties(self):
+        text = DynamicText(self._figure._suptitle)
+        for attr, value in (("rotation", 45), ("size", 14), ("text", "new"),
+                            ("visible", False), ("weight", "bold"),
+                            ("wrap", True)):
+            with self.subTest(attr=attr):
+                setattr(text, attr, value)
+                self.assertEqual(getattr(text, attr), value)
+
+        # check errors
+        cases = (
+            ("rotation", "45", TypeError,
+             "`rotation` must be a numeric representing the counterclockwise "
+             "rotation angle in degrees (received object of type: "),
+            ("size", "14", TypeError,
+             "`size` must be a numeric > 0 (received object of type: "),
+            ("size", 0, ValueError,
+             "`size` must be a numeric > 0 (received: 0)"),
+            ("text", 1, TypeError,
+             "`text` must be a string (received object of type: "),
+            ("visible", 1, TypeError,
+             "`visible` must be a boolean (received object of type: "),
+            ("weight", 700, TypeError,
+             "`weight` must be a string with one of the following values: "),
+            ("weight", "not a weight", ValueError,
+             "`weight` must be a string with one of the following values: "),
+        )
+        for attr, value, err_type, err_msg in cases:
+            with self.subTest(attr=attr, value=value):
+                with self.assertRaises(err_type) as cm:
+                    setattr(text, attr, value)
+                err_msg = f"[DynamicText.{attr}] {err_msg}"
+                self.assertTrue(str(cm.exception).startswith(err_msg),
+                                msg=str(cm.exception))
+
+    def test_wrap(self):
+        text = DynamicText(self._figure._suptitle)
+        text.wrap = True
+        self.assertTrue(text.wrap)
+        text.wrap = False
+        self.assertFalse(text.wrap)
+
+        # check errors
+        with self.assertRaises(TypeError) as cm:
+            text.wrap = 1
+        err_msg = ("[DynamicText.wrap] `wrap` must be a boolean (received "
+                   "object of type: ")
+        self.assertTrue(str(cm.exception).startswith(err_msg),
+                        msg=str(cm.exception))
+
+
+class AvailableFontsTests(unittest.TestCase):
+
+    def setUp(self):
+        # keep the on-disk font cache out of the user's matplotlib cache dir
+        temp_dir = tempfile.TemporaryDirectory()
+        self.addCleanup(temp_dir.cleanup)
+        self.cache_dir = temp_dir.name
+        patcher = mock.patch("matplotlib.get_cachedir",
+                             return_value=self.cache_dir)
+        patcher.start()
+        self.addCleanup(patcher.stop)
+        available_fonts.cache_clear()
+        self.addCleanup(available_fonts.cache_clear)
+
+    def test_disk_cache_round_trip(self):
+        stale_path = os.path.join(self.cache_dir, "curvefit-fonts-stale.json")
+        with open(stale_path, "w", encoding="utf-8") as stale_file:
+            stale_file.write("[]")
+
+        scanned = available_fonts(strict=True)  # populates the on-disk cache
+        cache_files = glob.glob(os.path.join(self.cache_dir,
+                                             "curvefit-fonts-*.json"))
+        self.assertEqual(len(cache_files), 1)  # stale cache was pruned
+        self.assertNotEqual(cache_files[0], stale_path)
+
+        # the second call is served from disk, without validating any fonts
+        available_fonts.cache_clear()
+        with mock.patch("matplotlib.font_manager.findfont") as findfont:
+            self.assertEqual(available_fonts(strict=True), scanned)
+        findfont.assert_not_called()
+
+    def test_strict_scan_is_subset(self):
+        # every font that survives validation is known to matplotlib
+        self.assertLessEqual(available_fonts(strict=True), available_fonts())
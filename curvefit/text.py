@@ -1,50 +1,297 @@
 from __future__ import annotations
-
-import matplotlib as mpl
-from matplotlib.font_manager import findfont, findSystemFonts, FontProperties, get_font
-
-from curvefit import NUMERIC, NUMERIC_TYPECHECK, error_trace
-from curvefit.callback import add_callback, callback_property, callbacks
+from collections.abc import Mapping
+from concurrent.futures import ThreadPoolExecutor
+from contextlib import contextmanager
+from copy import copy
+from functools import lru_cache, partial
+import glob
+import hashlib
+import json
+import os
+
+from typing import Any, Callable, Iterator, TYPE_CHECKING
+
+from curvefit import NUMERIC, NUMERIC_TYPECHECK
+from curvefit.callback import (add_callback, callback_property, callbacks,
+                               CallbackProperty)
 from curvefit.color import DynamicColor
 
+if TYPE_CHECKING:
+    from matplotlib.figure import Figure
+    from matplotlib.text import Text
+
 
 """
 TODO: Implement Sphinx documentation
 """
 
 
-SYSTEM_FONTS = set()
-for fpath in findSystemFonts():
+# membership tests hash the input once and then compare; calling sys.intern()
+# on user input first would only add a second dictionary lookup
+_ALLOWED_HALIGN = frozenset({"center", "right", "left"})
+_ALLOWED_VALIGN = frozenset({"center", "top", "bottom", "baseline",
+                             "center_baseline"})
+_ALLOWED_ALIGN_ALL = _ALLOWED_HALIGN | _ALLOWED_VALIGN
+_ALLOWED_WEIGHTS = frozenset({"ultralight", "light", "normal", "regular",
+                              "book", "medium", "roman", "semibold",
+                              "demibold", "demi", "bold", "heavy",
+                              "extra bold", "black"})
+
+# preformatted for error messages
+_ALLOWED_HALIGN_STR = str(set(_ALLOWED_HALIGN))
+_ALLOWED_VALIGN_STR = str(set(_ALLOWED_VALIGN))
+_ALLOWED_ALIGN_ALL_STR = str(set(_ALLOWED_ALIGN_ALL))
+_ALLOWED_WEIGHTS_STR = str(set(_ALLOWED_WEIGHTS))
+
+# reported by DynamicText.properties() and __repr__(), in this order
+_PROP_NAMES = ("alignment", "alpha", "color", "font", "rotation",
+               "line_spacing", "position", "size", "text", "visible",
+               "weight", "wrap")
+_PROP_NAME_SET = frozenset(_PROP_NAMES)
+
+
+def _font_cache_key(font_paths: list[str]) -> str:
+    """Hashes the path, modification time and size of every system font file,
+    so that the on-disk font cache is invalidated whenever fonts are added,
+    removed or replaced.
+    """
+    digest = hashlib.blake2b(digest_size=16)
+    for fpath in sorted(font_paths):
+        try:
+            stat = os.stat(fpath)
+        except OSError:
+            continue
+        digest.update(f"{fpath}\0{stat.st_mtime_ns}\0{stat.st_size}\n"
+                      .encode("utf-8", "surrogateescape"))
+    return digest.hexdigest()
+
+
+def _validate_font(fpath: str, known: dict[str, str]) -> str | None:
+    """Returns the family name of the font at `fpath`, or None if matplotlib
+    cannot actually render text with it.
+
+    `known` maps font files that matplotlib has already parsed to their
+    family names, so that only unfamiliar files are opened with FreeType.
+    """
+    from matplotlib.font_manager import findfont, FontProperties, get_font
+
     # matplotlib.font_manager.findSystemFonts() is a bit greedy and often
     # returns fonts that cannot actually be used by
     # matplotlib.text.Text.set_fontfamily()
     try:
-        font_family = get_font(fpath).family_name
-        font_prop = FontProperties(font_family)
-        findfont(font_prop, fallback_to_default=False)
-        SYSTEM_FONTS.add(font_family)
+        font_family = known.get(fpath)
+        if font_family is None:
+            font_family = get_font(fpath).family_name
+        findfont(FontProperties(font_family), fallback_to_default=False)
     except ValueError:
-        continue
+        return None
+    return font_family
+
+
+@lru_cache(maxsize=2)
+def available_fonts(strict: bool = False) -> frozenset[str]:
+    """Returns the names of every font family that can be used with
+    :attr:`DynamicText.font`.
+
+    By default, these are read directly from matplotlib's own font cache
+    (``matplotlib.font_manager.fontManager``), which lists every font
+    matplotlib can render without opening any font files.
+
+    If `strict` is True, every file returned by
+    ``matplotlib.font_manager.findSystemFonts()`` is instead opened and
+    validated individually.  This is slow, so the result is persisted to
+    matplotlib's cache directory, keyed by the modification times of the font
+    files themselves, so subsequent processes can skip the scan entirely.
+
+    Either result is computed on first use and cached afterwards.  Fonts
+    installed while the interpreter is running are not picked up until
+    ``available_fonts.cache_clear()`` is called.
+
+    Parameters
+    ----------
+    :param strict:
+        Whether to validate every system font file individually.
+    :type strict: bool
+    """
+    import matplotlib as mpl
+    from matplotlib.font_manager import findSystemFonts, fontManager
+
+    if not strict:
+        # fontManager is loaded when matplotlib.font_manager is first imported
+        # (which matplotlib.text does anyway), so this is just a set build
+        return frozenset(font.name for font in fontManager.ttflist)
+
+    font_paths = findSystemFonts()
+    cache_dir = mpl.get_cachedir()
+    cache_path = os.path.join(cache_dir,
+                              f"curvefit-fonts-{_font_cache_key(font_paths)}"
+                              f".json")
+    try:
+        with open(cache_path, "r", encoding="utf-8") as cache_file:
+            return frozenset(json.load(cache_file))
+    except (OSError, ValueError):
+        pass  # missing or corrupt cache -> rescan
+
+    # matplotlib's font cache already records the family name of every font
+    # file it has seen, so FreeType is only needed for files it has missed.
+    # Those are largely parsed outside the interpreter, so use a thread pool
+    known = {font.fname: font.name for font in fontManager.ttflist}
+    with ThreadPoolExecutor() as executor:
+        families = executor.map(partial(_validate_font, known=known),
+                                font_paths)
+        fonts = {family for family in families if family is not None}
+
+    try:
+        with open(cache_path, "w", encoding="utf-8") as cache_file:
+            json.dump(sorted(fonts), cache_file)
+    except OSError:
+        pass  # cache directory is not writable; scan again next time
+    else:
+        # caches written for an older set of fonts will never be read again
+        for stale_path in glob.glob(os.path.join(cache_dir,
+                                                 "curvefit-fonts-*.json")):
+            if stale_path != cache_path:
+                try:
+                    os.remove(stale_path)
+                except OSError:
+                    pass
+    return frozenset(fonts)
+
+
+@lru_cache(maxsize=1)
+def _font_list(fonts: frozenset[str]) -> str:
+    # keyed on the font set itself, so clearing available_fonts() also
+    # invalidates this
+    return "\n".join(sorted(fonts))
+
+
+def _font_error(trace: str, received_msg: str) -> str:
+    """Builds the error message for an invalid :attr:`DynamicText.font`.
+
+    Listing every available font is expensive, so this should only be called
+    once an error is actually being raised.
+    """
+    allowed_msg = _font_list(available_fonts())
+    return (f"[{trace}] `font` must be a string referencing one of the "
+            f"available system fonts: {allowed_msg}\n({received_msg})")
+
+
+def __getattr__(name: str):
+    # SYSTEM_FONTS is computed on first access rather than at import time
+    if name == "SYSTEM_FONTS":
+        return available_fonts()
+    raise AttributeError(f"module {__name__!r} has no attribute {name!r}")
+
+
+@lru_cache(maxsize=128)
+def _color_prototype(color_like: str | tuple[NUMERIC, ...]) -> DynamicColor:
+    # parsed once per color spec; never handed out directly, see _new_color()
+    return DynamicColor(color_like)
+
+
+def _new_color(color_like: str | tuple[NUMERIC, ...]) -> DynamicColor:
+    """Returns a new DynamicColor matching `color_like`.  Most text shares a
+    handful of starting colors, so each is only parsed once and then copied.
+    """
+    try:
+        return copy(_color_prototype(color_like))
+    except TypeError:  # unhashable color spec (e.g. a list or numpy array)
+        return DynamicColor(color_like)
+
+
+def _text_property(name: str,
+                   getter: str,
+                   setter: str,
+                   types: type | tuple[type, ...],
+                   requirement: str,
+                   is_valid: Callable[[Any], bool] | None = None,
+                   relayout: bool = True) -> CallbackProperty:
+    """Builds a CallbackProperty for :class:`DynamicText` that proxies a pair
+    of matplotlib.text.Text accessors.
+
+    New values are type checked against `types` and, if given, validated by
+    `is_valid` before being passed to matplotlib, after which the figure is
+    laid out again if `relayout` is True.  `requirement` completes the
+    sentence "`name` must be ..." in error messages.
+    """
+    def fget(self):
+        return getattr(self.obj, getter)()
+
+    def fset(self, value) -> None:
+        if not isinstance(value, types):
+            err_msg = (f"[DynamicText.{name}] `{name}` must be "
+                       f"{requirement} (received object of type: "
+                       f"{type(value)})")
+            raise TypeError(err_msg)
+        if is_valid is not None and not is_valid(value):
+            err_msg = (f"[DynamicText.{name}] `{name}` must be "
+                       f"{requirement} (received: {repr(value)})")
+            raise ValueError(err_msg)
+        if value == getattr(self.obj, getter)():
+            return  # no change -> skip the relayout
+        getattr(self.obj, setter)(value)
+        if relayout:
+            self._tight_layout()
+
+    return CallbackProperty(getter=fget, setter=fset)
+
+
+class _PropertyView(Mapping):
+    """Live, read-only view of a :class:`DynamicText`'s properties, as
+    returned by :meth:`DynamicText.properties`.
+    """
+
+    __slots__ = ("_text",)
+
+    def __init__(self, text: DynamicText):
+        self._text = text
+
+    def __getitem__(self, name: str) -> str | NUMERIC | bool | tuple:
+        if name not in _PROP_NAME_SET:
+            raise KeyError(name)
+        return getattr(self._text, name)
+
+    def __iter__(self) -> Iterator[str]:
+        return iter(_PROP_NAMES)
+
+    def __len__(self) -> int:
+        return len(_PROP_NAMES)
+
+    def __repr__(self) -> str:
+        return repr(dict(self))
 
 
 class DynamicText:
 
-    def __init__(self, text_obj: mpl.text.Text, **kwargs):
-        if not isinstance(text_obj, mpl.text.Text):
-            err_msg = (f"[{error_trace(self)}] `text_obj` must be an instance "
+    # callback_property keeps its per-instance state in weak-keyed
+    # containers, so instances must remain weak-referenceable
+    __slots__ = ("obj", "_color", "_figure", "_layout_pending",
+                 "_line_spacing", "_suspend_layout", "__weakref__")
+
+    def __init__(self, text_obj: Text, **kwargs):
+        # matplotlib.text (and with it, matplotlib.font_manager) is only
+        # imported once a DynamicText is actually constructed
+        from matplotlib.text import Text
+
+        if not isinstance(text_obj, Text):
+            err_msg = (f"[DynamicText.__init__] `text_obj` must be an instance "
                        f"of matplotlib.text.Text (received object of type: "
                        f"{type(text_obj)})")
             raise TypeError(err_msg)
         self.obj = text_obj
+        self._figure = text_obj.get_figure()
         # matplotlib.text.Text apparently doesn't have a get_linespacing method
         # see matplotlib.text.Text.set_linespacing if default changes in future
         self._line_spacing = 1.2  # matplotlib default value (02/07/2022)
-        self._color = DynamicColor(self.obj.get_color())
+        self._suspend_layout = False
+        self._layout_pending = False
+        self._color = _new_color(self.obj.get_color())
         add_callback(self._color,
                      DynamicColor.callback_properties,
                      self.update_color)
-        for k, v in kwargs.items():
-            setattr(self, k, v)
+        with self.batch_update():
+            for k, v in kwargs.items():
+                setattr(self, k, v)
 
     @callback_property
     def alignment(self) -> tuple[str]:
@@ -54,47 +301,49 @@ class DynamicText:
 
     @alignment.setter
     def alignment(self, new_alignment: str | tuple[str, str]) -> None:
-        allowed_horizontal = {"center", "right", "left"}
-        allowed_vertical = {"center", "top", "bottom", "baseline",
-                            "center_baseline"}
         if not isinstance(new_alignment, (str, tuple)):
-            err_msg = (f"[{error_trace(self)}] `alignment` must be a string "
+            err_msg = (f"[DynamicText.alignment] `alignment` must be a string "
                        f"or tuple of strings `(horizontal, vertical)` with one "
                        f"of the following horizontal values: "
-                       f"{allowed_horizontal}, and/or one of the following "
-                       f"vertical values {allowed_vertical} (received object "
-                       f"of type: {type(new_alignment)})")
+                       f"{_ALLOWED_HALIGN_STR}, and/or one of the "
+                       f"following vertical values {_ALLOWED_VALIGN_STR} "
+                       f"(received object of type: {type(new_alignment)})")
             raise TypeError(err_msg)
         if isinstance(new_alignment, tuple):
             horizontal = new_alignment[0]
             vertical = new_alignment[1]
-            if horizontal not in allowed_horizontal:
-                err_msg = (f"[{error_trace(self)}] when given a tuple, the "
+            if horizontal not in _ALLOWED_HALIGN:
+                err_msg = (f"[DynamicText.alignment] when given a tuple, the "
                            f"first element of `alignment` must have one of "
-                           f"the following values: {allowed_horizontal} "
+                           f"the following values: {_ALLOWED_HALIGN_STR} "
                            f"(received: {repr(new_alignment)})")
                 raise ValueError(err_msg)
-            if vertical not in allowed_vertical:
-                err_msg = (f"[{error_trace(self)}] when given a tuple, the "
+            if vertical not in _ALLOWED_VALIGN:
+                err_msg = (f"[DynamicText.alignment] when given a tuple, the "
                            f"second element of `alignment` must have one of "
-                           f"the following values: {allowed_vertical} "
+                           f"the following values: {_ALLOWED_VALIGN_STR} "
                            f"(received: {repr(new_alignment)})")
                 raise ValueError(err_msg)
+            if (horizontal, vertical) == self.alignment:
+                return  # no change -> skip the relayout
             self.obj.set_horizontalalignment(horizontal)
             self.obj.set_verticalalignment(vertical)
         else:
-            if new_alignment in allowed_horizontal:
+            if new_alignment in _ALLOWED_HALIGN:
+                if new_alignment == self.obj.get_horizontalalignment():
+                    return
                 self.obj.set_horizontalalignment(new_alignment)
-            elif new_alignment in allowed_vertical:
+            elif new_alignment in _ALLOWED_VALIGN:
+                if new_alignment == self.obj.get_verticalalignment():
+                    return
                 self.obj.set_verticalalignment(new_alignment)
             else:
-                allowed_combined = allowed_horizontal.union(allowed_vertical)
-                err_msg = (f"[{error_trace(self)}] when given a string, "
+                err_msg = (f"[DynamicText.alignment] when given a string, "
                            f"`alignment` must have one of the following "
-                           f"values: {allowed_combined}, (received: "
+                           f"values: {_ALLOWED_ALIGN_ALL_STR}, (received: "
                            f"{repr(new_alignment)})")
                 raise ValueError(err_msg)
-        self.obj.get_figure().tight_layout()
+        self._tight_layout()
 
     @callback_property
     def alpha(self) -> float:
@@ -116,6 +365,14 @@ class DynamicText:
         self._color = DynamicColor(new_color, alpha=self.alpha)
         add_callback(self._color, old_callbacks)
 
+    @property
+    def figure(self) -> Figure | None:
+        # matplotlib forbids moving an artist between figures, so once the
+        # text is attached to one, the cached handle stays valid
+        if self._figure is None:
+            self._figure = self.obj.get_figure()
+        return self._figure
+
     @callback_property
     def font(self) -> str:
         return self.obj.get_fontfamily()[0]  # should only ever have 1 font
@@ -123,35 +380,16 @@ class DynamicText:
     @font.setter
     def font(self, new_font: str) -> None:
         if not isinstance(new_font, str):
-            allowed_msg = "\n".join(sorted(SYSTEM_FONTS))
-            err_msg = (f"[{error_trace(self)}] `font` must be a string "
-                       f"referencing one of the available system fonts: "
-                       f"{allowed_msg}\n(received object of type: "
-                       f"{type(new_font)})")
-            raise TypeError(err_msg)
-        if new_font not in SYSTEM_FONTS:
-            allowed_msg = "\n".join(sorted(SYSTEM_FONTS))
-            err_msg = (f"[{error_trace(self)}] `font` must be a string "
-                       f"referencing one of the available system fonts: "
-                       f"{allowed_msg}\n(received: {repr(new_font)})")
-            raise ValueError(err_msg)
+            raise TypeError(_font_error("DynamicText.font",
+                                        f"received object of type: "
+                                        f"{type(new_font)}"))
+        if new_font not in available_fonts():
+            raise ValueError(_font_error("DynamicText.font",
+                                         f"received: {repr(new_font)}"))
+        if new_font == self.font:
+            return  # no change -> skip the relayout
         self.obj.set_fontfamily(new_font)
-        self.obj.get_figure().tight_layout()
-
-    @callback_property
-    def rotation(self) -> float:
-        return self.obj.get_rotation()
-
-    @rotation.setter
-    def rotation(self, new_rotation: NUMERIC) -> None:
-        if not isinstance(new_rotation, NUMERIC_TYPECHECK):
-            err_msg = (f"[{error_trace(self)}] `rotation` must be a numeric "
-                       f"representing the counterclockwise rotation angle in "
-                       f"degrees (received object of type: "
-                       f"{type(new_rotation)})")
-            raise TypeError(err_msg)
-        self.obj.set_rotation(new_rotation)
-        self.obj.get_figure().tight_layout()
+        self._tight_layout()
 
     @callback_property
     def line_spacing(self) -> float:
@@ -160,18 +398,20 @@ class DynamicText:
     @line_spacing.setter
     def line_spacing(self, new_line_spacing: NUMERIC) -> None:
         if not isinstance(new_line_spacing, NUMERIC_TYPECHECK):
-            err_msg = (f"[{error_trace(self)}] `line_spacing` must be a "
+            err_msg = (f"[DynamicText.line_spacing] `line_spacing` must be a "
                        f"numeric >= 1 representing a multiple of `font_size` "
                        f"(received object of type: {type(new_line_spacing)})")
             raise TypeError(err_msg)
         if not new_line_spacing >= 1:
-            err_msg = (f"[{error_trace(self)}] `line_spacing` must be a "
+            err_msg = (f"[DynamicText.line_spacing] `line_spacing` must be a "
                        f"numeric >= 1 representing a multiple of `font_size` "
                        f"(received: {repr(new_line_spacing)})")
             raise ValueError(err_msg)
+        if new_line_spacing == self._line_spacing:
+            return  # no change -> skip the relayout
         self._line_spacing = float(new_line_spacing)
         self.obj.set_linespacing(self._line_spacing)
-        self.obj.get_figure().tight_layout()
+        self._tight_layout()
 
     @callback_property
     def position(self) -> tuple[float, float]:
@@ -180,114 +420,91 @@ class DynamicText:
     @position.setter
     def position(self, new_position: tuple[NUMERIC, NUMERIC]) -> None:
         if not isinstance(new_position, tuple):
-            err_msg = (f"[{error_trace(self)}] `position` must be an `(x, y)` "
+            err_msg = (f"[DynamicText.position] `position` must be an `(x, y)` "
                        f"tuple of length 2 containing only numerics between 0 "
                        f"and 1 (received object of type: {type(new_position)})")
             raise TypeError(err_msg)
-        if (len(new_position) != 2 or
-            not all(isinstance(v, NUMERIC_TYPECHECK) for v in new_position) or
-            not all(0 <= v <= 1 for v in new_position)):
-            err_msg = (f"[{error_trace(self)}] `position` must be an `(x, y)` "
+        if len(new_position) == 2:
+            x, y = new_position
+            valid = (isinstance(x, NUMERIC_TYPECHECK) and
+                     isinstance(y, NUMERIC_TYPECHECK) and
+                     0 <= x <= 1 and 0 <= y <= 1)
+        else:
+            valid = False
+        if not valid:
+            err_msg = (f"[DynamicText.position] `position` must be an `(x, y)` "
                        f"tuple of length 2 containing only numerics between 0 "
                        f"and 1 (received: {repr(new_position)})")
             raise ValueError(err_msg)
+        if new_position == self.obj.get_position():
+            return  # no change -> skip the relayout
         self.obj.set_position(new_position)
-        self.obj.get_figure().tight_layout()
-
-    @callback_property
-    def size(self) -> float:
-        return self.obj.get_fontsize()
-
-    @size.setter
-    def size(self, new_size: NUMERIC) -> None:
-        if not isinstance(new_size, NUMERIC_TYPECHECK):
-            err_msg = (f"[{error_trace(self)}] `size` must be a numeric > 0 "
-                       f"(received object of type: {type(new_size)})")
-            raise TypeError(err_msg)
-        if not new_size > 0:
-            err_msg = (f"[{error_trace(self)}] `size` must be a numeric > 0 "
-                       f"(received: {repr(new_size)})")
-            raise ValueError(err_msg)
-        self.obj.set_fontsize(new_size)
-        self.obj.get_figure().tight_layout()
-
-    @callback_property
-    def text(self) -> str:
-        return self.obj.get_text()
-
-    @text.setter
-    def text(self, new_text: str) -> None:
-        if not isinstance(new_text, str):
-            err_msg = (f"[{error_trace(self)}] `text` must be a string "
-                       f"(received object of type: {type(new_text)})")
-            raise TypeError(err_msg)
-        self.obj.set_text(new_text)
-
-    @callback_property
-    def visible(self) -> bool:
-        return self.obj.get_visible()
-
-    @visible.setter
-    def visible(self, new_visible: bool) -> None:
-        if not isinstance(new_visible, bool):
-            err_msg = (f"[{error_trace(self)}] `visible` must be a boolean "
-                       f"(received object of type: {type(new_visible)})")
-            raise TypeError(err_msg)
-        self.obj.set_visible(new_visible)
-        self.obj.get_figure().tight_layout()
-
-    @callback_property
-    def weight(self) -> str:
-        return self.obj.get_fontweight()
-
-    @weight.setter
-    def weight(self, new_weight: str) -> None:
-        allowed = {"ultralight", "light", "normal", "regular", "book", "medium",
-                   "roman", "semibold", "demibold", "demi", "bold", "heavy",
-                   "extra bold", "black"}
-        if not isinstance(new_weight, str):
-            err_msg = (f"[{error_trace(self)}] `weight` must be a string with "
-                       f"one of the following values: {allowed} (received "
-                       f"object of type: {type(new_weight)}")
-            raise TypeError(err_msg)
-        if new_weight not in allowed:
-            err_msg = (f"[{error_trace(self)}] `weight` must be a string with "
-                       f"one of the following values: {allowed} (received: "
-                       f"{repr(new_weight)})")
-            raise ValueError(err_msg)
-        self.obj.set_fontweight(new_weight)
-        self.obj.get_figure().tight_layout()
-
-    @callback_property
-    def wrap(self) -> bool:
-        return self.obj.get_wrap()
-
-    @wrap.setter
-    def wrap(self, new_wrap: bool) -> None:
-        if not isinstance(new_wrap, bool):
-            err_msg = (f"[{error_trace(self)}] `autowrap` must be a boolean "
-                       f"(received object of type: {type(new_wrap)})")
-            raise TypeError(err_msg)
-        self.obj.set_wrap(new_wrap)
-        self.obj.get_figure().tight_layout()
-
-    def properties(
-        self) -> dict[str, str | NUMERIC | bool | tuple[NUMERIC, ...]]:
-        prop_dict = {
-            "alignment": self.alignment,
-            "alpha": self.alpha,
-            "color": self.color,
-            "font": self.font,
-            "rotation": self.rotation,
-            "line_spacing": self.line_spacing,
-            "position": self.position,
-            "size": self.size,
-            "text": self.text,
-            "visible": self.visible,
-            "weight": self.weight,
-            "wrap": self.wrap,
-        }
-        return prop_dict
+        self._tight_layout()
+
+    rotation = _text_property(
+        "rotation", "get_rotation", "set_rotation", NUMERIC_TYPECHECK,
+        "a numeric representing the counterclockwise rotation angle in "
+        "degrees")
+
+    size = _text_property(
+        "size", "get_fontsize", "set_fontsize", NUMERIC_TYPECHECK,
+        "a numeric > 0", lambda v: v > 0)
+
+    text = _text_property(
+        "text", "get_text", "set_text", str, "a string", relayout=False)
+
+    visible = _text_property(
+        "visible", "get_visible", "set_visible", bool, "a boolean")
+
+    weight = _text_property(
+        "weight", "get_fontweight", "set_fontweight", str,
+        f"a string with one of the following values: "
+        f"{_ALLOWED_WEIGHTS_STR}", _ALLOWED_WEIGHTS.__contains__)
+
+    wrap = _text_property("wrap", "get_wrap", "set_wrap", bool, "a boolean")
+
+    @contextmanager
+    def batch_update(self, relayout: bool = True) -> Iterator[DynamicText]:
+        """Context manager that defers figure relayouts until the end of the
+        block, so that setting several properties in a row triggers at most
+        one call to ``tight_layout()``.
+
+        Callers that lay out the figure themselves afterwards can pass
+        ``relayout=False`` to skip that final call altogether.  Nested blocks
+        defer to the outermost one.
+        """
+        if self._suspend_layout:  # nested -> outermost block does the layout
+            yield self
+            return
+        self._suspend_layout = True
+        try:
+            yield self
+        finally:
+            self._suspend_layout = False
+            if self._layout_pending:
+                self._layout_pending = False
+                if relayout:
+                    self.figure.tight_layout()
+
+    def _tight_layout(self) -> None:
+        if self._suspend_layout:
+            self._layout_pending = True
+        elif self._figure is not None:  # read the slot directly when cached
+            self._figure.tight_layout()
+        else:
+            self.figure.tight_layout()
+
+    def properties(self) -> _PropertyView:
+        """Returns a read-only mapping of every property name to its current
+        value.  Values are looked up on access, so reading a single key only
+        queries that one property, and the mapping always reflects the
+        current state of the text.  Use ``dict(text.properties())`` for a
+        snapshot.
+        """
+        # not memoized: the underlying Text can be modified directly, and its
+        # `stale` flag is cleared on every draw, so it cannot tell whether a
+        # cached snapshot is still current
+        return _PropertyView(self)
 
     def update_color(self, color: DynamicColor) -> None:
         self.obj.set_color(color.rgba)
@@ -301,7 +518,7 @@ class DynamicText:
         return hash(id(self))
 
     def __repr__(self) -> str:
-        props = [f"{k}={repr(v)}" for k, v in self.properties().items()]
+        props = [f"{name}={getattr(self, name)!r}" for name in _PROP_NAMES]
         return f"DynamicText({repr(self.obj)}, {', '.join(props)})"
 
     def __str__(self) -> str: